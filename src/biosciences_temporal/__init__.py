@@ -38,16 +38,16 @@ biosciences_temporal/
 
 ### Standalone (no Temporal)
 ```bash
-uv run python -m src.biosciences_temporal.scripts.run_agent
+uv run run-agent
 ```
 
 ### With Temporal
 ```bash
 # Terminal 1: Start worker
-uv run python -m src.biosciences_temporal.scripts.run_worker
+uv run run-worker
 
 # Terminal 2: Trigger workflow
-uv run python -m src.biosciences_temporal.scripts.run_workflow
+uv run run-workflow
 ```
 
 IMPORTANT: Do not add imports here - they trigger Temporal sandbox restrictions.
@@ -58,11 +58,11 @@ Import directly from the specific module you need.
 # Import directly from the specific modules:
 #
 # Agents (standalone):
-#   from src.biosciences_temporal.agents.cq14 import CQ14Orchestrator
-#   from src.biosciences_temporal.agents import GeneInfo, DrugCandidate, ...
+#   from biosciences_temporal.agents.cq14 import CQ14Orchestrator
+#   from biosciences_temporal.agents import GeneInfo, DrugCandidate, ...
 #
 # Temporal:
-#   from src.biosciences_temporal.temporal.workflows import CQ14Workflow
-#   from src.biosciences_temporal.temporal.activities import ALL_ACTIVITIES
+#   from biosciences_temporal.temporal.workflows import CQ14Workflow
+#   from biosciences_temporal.temporal.activities import ALL_ACTIVITIES
 
 __all__: list[str] = []  # Explicit empty exports to encourage direct imports
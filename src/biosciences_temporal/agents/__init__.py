@@ -12,7 +12,15 @@ from .models import (
     ProteinFunction,
     ValidationEvidence,
 )
-from .base import create_mcp_client, MODEL, USAGE_LIMITS
+from .base import (
+    create_mcp_client,
+    is_retryable,
+    shutdown_pool,
+    warm_pool,
+    MODEL,
+    USAGE_LIMITS,
+    USAGE_LIMITS_SIMPLE,
+)
 
 __all__ = [
     # Models
@@ -24,6 +32,10 @@ __all__ = [
     "ValidationEvidence",
     # Utilities
     "create_mcp_client",
+    "is_retryable",
+    "shutdown_pool",
+    "warm_pool",
     "MODEL",
     "USAGE_LIMITS",
+    "USAGE_LIMITS_SIMPLE",
 ]
@@ -1,16 +1,28 @@
 """
 Base utilities for CQ14 agents.
 
-Provides the MCP client factory, shared configuration, and AgentRunner helper.
+Provides the MCP client factory and pool, shared configuration, and
+AgentRunner helper.
 """
 
+import asyncio
+import functools
+import importlib
+import importlib.util
 import os
-from dataclasses import dataclass
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Generic, TypeVar
+from typing import Generic, ParamSpec, TypeVar
 
+import httpx
 from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
 from pydantic_ai.mcp import MCPServerStdio
+from pydantic_ai.toolsets import AbstractToolset
 from pydantic_ai.usage import UsageLimits
 
 
@@ -55,44 +67,280 @@ def _find_sibling_repo() -> str:
     )
 
 
-BIOSCIENCES_MCP_PATH = _find_sibling_repo()
+def _use_inprocess_gateway() -> bool:
+    """Whether the gateway can run in-process instead of as a subprocess.
 
-# Gateway server module path
-GATEWAY_SERVER = "src/biosciences_mcp/servers/gateway.py"
+    True when biosciences_mcp and fastmcp are importable, unless
+    BIOSCIENCES_MCP_FORCE_STDIO=1 is set.
+    """
+    if os.environ.get("BIOSCIENCES_MCP_FORCE_STDIO") == "1":
+        return False
+    return all(
+        importlib.util.find_spec(name) is not None
+        for name in ("biosciences_mcp", "fastmcp")
+    )
 
-# Default model for agents
-MODEL = "openai:gpt-4.1-mini"
 
-# Higher usage limits for complex agents (default is 50 requests)
-USAGE_LIMITS = UsageLimits(request_limit=100)
+USE_INPROCESS_GATEWAY = _use_inprocess_gateway()
 
+# Only the stdio transport needs the biosciences-mcp checkout
+BIOSCIENCES_MCP_PATH = None if USE_INPROCESS_GATEWAY else _find_sibling_repo()
 
-def create_mcp_client() -> MCPServerStdio:
-    """Create MCP client using stdio transport.
+# Gateway server module path (stdio) and import path (in-process)
+GATEWAY_SERVER = "src/biosciences_mcp/servers/gateway.py"
+GATEWAY_MODULE = "biosciences_mcp.servers.gateway"
 
-    Uses stdio transport to avoid async cancel scope issues with Temporal.
-    The server runs as a subprocess in the biosciences-mcp project.
+# Default model for agents
+MODEL = "openai:gpt-4.1-mini"
+
+# Per-phase usage limits. Tight limits fail runaway tool loops early so
+# the retry/backoff path kicks in sooner.
+# Multi-step agents (expand, drugs, SL and batched validation)
+USAGE_LIMITS = UsageLimits(request_limit=50)
+# Single-lookup agents (resolve, enrich, trials, per-entity validators)
+USAGE_LIMITS_SIMPLE = UsageLimits(request_limit=10)
+
+# Retry with full-jitter exponential backoff for transient failures:
+# delay = random(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+# Parent environment for the MCP subprocess (includes API keys).
+# Captured once at import: the environment is fixed for the worker's lifetime.
+_FROZEN_ENV = os.environ.copy()
+
+
+@functools.cache
+def _inprocess_gateway():
+    """Import the gateway and return its FastMCP server object."""
+    gateway = importlib.import_module(GATEWAY_MODULE)
+    # Same attribute names `fastmcp run` looks for
+    for name in ("mcp", "server", "app"):
+        if (server := getattr(gateway, name, None)) is not None:
+            return server
+    raise AttributeError(f"{GATEWAY_MODULE} defines no mcp, server or app object")
+
+
+def create_mcp_client() -> AbstractToolset:
+    """Create MCP client for the biosciences gateway.
+
+    When biosciences_mcp is importable the gateway runs in-process over
+    FastMCP's in-memory transport, avoiding the subprocess and stdio pipes.
+    Otherwise uses stdio transport to avoid async cancel scope issues with
+    Temporal. The server runs as a subprocess in the biosciences-mcp project.
     Environment variables are passed explicitly to ensure API keys are available.
 
     Returns:
-        MCPServerStdio configured to run the biosciences gateway server.
+        Toolset connected to the biosciences gateway server.
     """
-    # Pass parent environment to subprocess (includes API keys)
-    env = os.environ.copy()
+    if USE_INPROCESS_GATEWAY:
+        from pydantic_ai.toolsets.fastmcp import FastMCPToolset
+
+        return FastMCPToolset(_inprocess_gateway(), id='biosciences_mcp')
 
     return MCPServerStdio(
         command='uv',
         args=['run', 'fastmcp', 'run', GATEWAY_SERVER],
         cwd=BIOSCIENCES_MCP_PATH,
-        env=env,
+        env=_FROZEN_ENV,
         id='biosciences_mcp',
         timeout=120.0,
     )
 
 
-# --- Agent Metadata ---
+# --- MCP Client Pool ---
+
+PoolKey = tuple[str, tuple[str, ...], str]
+
 
 @dataclass
+class _PooledServer:
+    """A pooled MCP server and the task that owns its lifecycle."""
+    server: AbstractToolset
+    ready: asyncio.Future
+    stop: asyncio.Event = field(default_factory=asyncio.Event)
+    owner: asyncio.Task | None = None
+
+
+class MCPClientPool:
+    """Process-wide pool of long-lived MCP server subprocesses.
+
+    Spawning the gateway (``uv run fastmcp run ...``) and completing the MCP
+    ``initialize`` handshake costs seconds, so each server is started once and
+    shared by every AgentRunner. The gateway is stateless across calls, so a
+    single server per ``(command, args, cwd)`` serves concurrent agent runs.
+
+    Each server's ``async with`` is entered and exited by a dedicated owner
+    task. This keeps the anyio cancel scope inside one task even though many
+    activity tasks use the connection (see CLAUDE.md, Known Issues).
+    """
+
+    def __init__(self) -> None:
+        self._servers: dict[PoolKey, _PooledServer] = {}
+        self._lock = asyncio.Lock()
+        self._default_key: PoolKey | None = None
+
+    @staticmethod
+    def _key(server: AbstractToolset) -> PoolKey:
+        if isinstance(server, MCPServerStdio):
+            return (server.command, tuple(server.args), str(server.cwd))
+        return ("in-process", (GATEWAY_MODULE,), "")
+
+    async def acquire(self) -> AbstractToolset:
+        """Return a running MCP server, starting it on first use.
+
+        Concurrent callers for the same key share a single startup.
+
+        Returns:
+            A connected MCP toolset shared with other callers.
+        """
+        # Hot path: the server is already pooled, no client is constructed.
+        # Before the first start the key is unknown, so go straight to _start
+        entry = None
+        if self._default_key is not None:
+            entry = self._servers.get(self._default_key)
+        if entry is None:
+            entry = await self._start()
+
+        return await asyncio.shield(entry.ready)
+
+    async def _start(self) -> _PooledServer:
+        """Return the pool entry for the default server, creating it if needed."""
+        candidate = create_mcp_client()
+        # create_mcp_client() config is fixed for the process lifetime
+        key = self._default_key = self._key(candidate)
+
+        async with self._lock:
+            entry = self._servers.get(key)
+            if entry is None:
+                entry = _PooledServer(
+                    server=candidate,
+                    ready=asyncio.get_running_loop().create_future(),
+                )
+                entry.owner = asyncio.create_task(
+                    self._own(key, entry), name=f"mcp-pool:{candidate.id}"
+                )
+                self._servers[key] = entry
+        return entry
+
+    async def shutdown(self) -> None:
+        """Stop every pooled server and wait for the subprocesses to exit."""
+        async with self._lock:
+            entries = list(self._servers.values())
+            self._servers.clear()
+
+        for entry in entries:
+            entry.stop.set()
+        await asyncio.gather(
+            *(e.owner for e in entries if e.owner is not None),
+            return_exceptions=True,
+        )
+
+    async def _own(self, key: PoolKey, entry: _PooledServer) -> None:
+        """Hold the server open until shutdown, in a single task."""
+        try:
+            async with entry.server:
+                entry.ready.set_result(entry.server)
+                await entry.stop.wait()
+        except BaseException as e:
+            if not entry.ready.done():
+                entry.ready.set_exception(e)
+            raise
+        finally:
+            # Drop a failed server so the next acquire() starts a fresh one
+            if self._servers.get(key) is entry:
+                del self._servers[key]
+
+
+_pool = MCPClientPool()
+
+
+async def warm_pool() -> None:
+    """Start the pooled MCP server ahead of the first agent run.
+
+    Call at worker startup so the first workflow doesn't pay the gateway
+    cold start. One server serves all concurrent runs, so one is enough.
+    """
+    await _pool.acquire()
+
+
+async def shutdown_pool() -> None:
+    """Stop all pooled MCP servers. Call once when the process is done."""
+    await _pool.shutdown()
+
+
+# --- Result Cache ---
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+async def _single_flight(
+    inflight: dict[Hashable, asyncio.Future],
+    key: Hashable,
+    call: Callable[[], Awaitable[R]],
+) -> R:
+    """Run ``call`` once per key; concurrent callers await the same task."""
+    task = inflight.get(key)
+    if task is None:
+        task = inflight[key] = asyncio.ensure_future(call())
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    # Shield so one caller's cancellation doesn't cancel the others
+    return await asyncio.shield(task)
+
+
+def agent_cache(
+    key: Callable[..., Hashable],
+    maxsize: int = 1024,
+    ttl: float | None = None,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Memoize an async agent call for deterministic, read-only lookups.
+
+    Results are kept in an LRU keyed by ``key(*args, **kwargs)``. Concurrent
+    calls for the same key share one in-flight call instead of each running
+    the agent. Failures are not cached.
+
+    Args:
+        key: Builds the cache key from the call arguments (normalize here).
+        maxsize: Maximum number of cached results.
+        ttl: Seconds before an entry expires (default: never).
+
+    Returns:
+        Decorator for an async function.
+    """
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        entries: OrderedDict[Hashable, tuple[float, R]] = OrderedDict()
+        inflight: dict[Hashable, asyncio.Future[R]] = {}
+
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            k = key(*args, **kwargs)
+
+            if (hit := entries.get(k)) is not None:
+                stored_at, value = hit
+                if ttl is None or time.monotonic() - stored_at < ttl:
+                    entries.move_to_end(k)
+                    return value
+                del entries[k]
+
+            value = await _single_flight(inflight, k, lambda: fn(*args, **kwargs))
+
+            entries[k] = (time.monotonic(), value)
+            entries.move_to_end(k)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+# --- Agent Metadata ---
+
+@dataclass(slots=True)
 class AgentMetadata:
     """Structured metadata for agent spans in Logfire.
 
@@ -103,23 +351,48 @@ class AgentMetadata:
     entity_type: str # gene, protein, interaction, compound, trial, gene_pair
     source: str      # HGNC, UniProt, STRING, BioGRID, ChEMBL, ClinicalTrials.gov
     cq_id: str = "cq14"
+    _default_dict: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._default_dict = {
+            "phase": self.phase,
+            "action": self.action,
+            "entity_type": self.entity_type,
+            "source": self.source,
+            "cq_id": self.cq_id,
+        }
 
     def to_dict(self, cq_id: str | None = None) -> dict:
         """Convert to metadata dict for PydanticAI Agent.
 
+        The dict for the default cq_id is built once and shared; callers
+        must not mutate it.
+
         Args:
             cq_id: Override the default cq_id if provided.
 
         Returns:
             Dictionary suitable for Agent metadata parameter.
         """
-        return {
-            "phase": self.phase,
-            "action": self.action,
-            "entity_type": self.entity_type,
-            "source": self.source,
-            "cq_id": cq_id or self.cq_id,
-        }
+        if not cq_id or cq_id == self.cq_id:
+            return self._default_dict
+        return {**self._default_dict, "cq_id": cq_id}
+
+
+# --- Retry Classification ---
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an agent run failure is transient and worth retrying.
+
+    Rate limits (429), server errors (5xx), timeouts and transport errors
+    are retried. Other 4xx responses indicate a bad request and are not.
+    """
+    if isinstance(error, ModelHTTPError):
+        return error.status_code == 429 or error.status_code >= 500
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, (TimeoutError, httpx.HTTPError))
 
 
 # --- Agent Runner ---
@@ -131,9 +404,11 @@ class AgentRunner(Generic[T]):
     """Factory for running PydanticAI agents with MCP toolsets.
 
     Reduces boilerplate by encapsulating:
-    - MCP client lifecycle management
-    - Agent construction with consistent configuration
+    - MCP client acquisition from the shared pool
+    - Agent construction with consistent configuration, cached per runner
     - Metadata and usage limits
+    - Full-jitter retry of transient failures
+    - Coalescing of identical concurrent runs
 
     Example:
         >>> runner = AgentRunner(
@@ -150,6 +425,9 @@ class AgentRunner(Generic[T]):
         >>> result = await runner.run("Resolve gene: TP53")
     """
 
+    # In-flight runs shared across all runners, keyed by (name, prompt, cq_id)
+    _inflight: dict[Hashable, asyncio.Future] = {}
+
     def __init__(
         self,
         output_type: type[T],
@@ -158,6 +436,8 @@ class AgentRunner(Generic[T]):
         metadata: AgentMetadata,
         model: str = MODEL,
         usage_limits: UsageLimits = USAGE_LIMITS,
+        max_retries: int = MAX_RETRIES,
+        tools: frozenset[str] | None = None,
     ):
         """Initialize the agent runner.
 
@@ -168,6 +448,9 @@ class AgentRunner(Generic[T]):
             metadata: Structured metadata for tracing.
             model: Model identifier (default: MODEL constant).
             usage_limits: Request limits (default: USAGE_LIMITS constant).
+            max_retries: Retries for transient failures (default: MAX_RETRIES).
+            tools: Gateway tools the agent may call (default: all). Single-lookup
+                agents list just their tool so each request carries one schema.
         """
         self.output_type = output_type
         self.instructions = instructions
@@ -175,12 +458,44 @@ class AgentRunner(Generic[T]):
         self.metadata = metadata
         self.model = model
         self.usage_limits = usage_limits
+        self.max_retries = max_retries
+        self.tools = tools
+
+        # The Agent is built once per pooled MCP server and reused; metadata
+        # (including the cq_id) is passed per run. The cache lives on the
+        # runner, so instructions are never compared.
+        self._agent: Agent[None, T] | None = None
+        self._agent_mcp: AbstractToolset | None = None
+
+    def _get_agent(self, mcp: AbstractToolset) -> Agent[None, T]:
+        """Return the cached Agent for this MCP server."""
+        if self._agent is None or self._agent_mcp is not mcp:
+            # First use, or the pool restarted the server and the old agent is stale
+            self._agent = Agent(
+                self.model,
+                output_type=self.output_type,
+                instructions=self.instructions,
+                name=self.name,
+                toolsets=[self._toolset(mcp)],
+            )
+            self._agent_mcp = mcp
+        return self._agent
+
+    def _toolset(self, mcp: AbstractToolset) -> AbstractToolset:
+        """Restrict the pooled server to this runner's tools, if any."""
+        if self.tools is None:
+            return mcp
+        tools = self.tools
+        return mcp.filtered(lambda ctx, tool_def: tool_def.name in tools)
 
     async def run(self, prompt: str, cq_id: str | None = None) -> T:
-        """Execute the agent with MCP lifecycle contained.
+        """Execute the agent using a pooled MCP client.
 
-        The MCP client is created, used, and closed within this single call,
-        ensuring the anyio cancel scope is properly managed within one task.
+        Identical concurrent calls (same runner, prompt and cq_id) share a
+        single agent run. The MCP server is shared from the process-wide
+        pool; its lifecycle is owned by the pool, not this task.
+        Transient failures (429, 5xx, timeouts) are retried with full-jitter
+        exponential backoff so parallel runs don't retry in lockstep.
 
         Args:
             prompt: The prompt to send to the agent.
@@ -189,16 +504,28 @@ class AgentRunner(Generic[T]):
         Returns:
             The structured output from the agent.
         """
-        mcp = create_mcp_client()
-
-        async with mcp:
-            agent = Agent(
-                self.model,
-                output_type=self.output_type,
-                instructions=self.instructions,
-                name=self.name,
-                toolsets=[mcp],
-                metadata=self.metadata.to_dict(cq_id),
-            )
-            result = await agent.run(prompt, usage_limits=self.usage_limits)
-            return result.output
+        key = (self.name, prompt, cq_id or self.metadata.cq_id)
+        return await _single_flight(
+            AgentRunner._inflight, key, lambda: self._run(prompt, cq_id)
+        )
+
+    async def _run(self, prompt: str, cq_id: str | None) -> T:
+        """Run the agent once, retrying transient failures."""
+        mcp = await _pool.acquire()
+        agent = self._get_agent(mcp)
+        metadata = self.metadata.to_dict(cq_id)
+        attempt = 0
+        while True:
+            try:
+                result = await agent.run(
+                    prompt, usage_limits=self.usage_limits, metadata=metadata
+                )
+                # Already typed: pydantic_ai validates the output tool-call
+                # JSON straight into output_type in one pass, no re-parse
+                return result.output
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                cap = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+                await asyncio.sleep(random.uniform(0, cap))
+                attempt += 1
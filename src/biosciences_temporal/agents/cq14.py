@@ -5,16 +5,18 @@ Coordinates the 5-phase Fuzzy-to-Fact protocol for validating
 synthetic lethality claims. Can run without Temporal.
 
 Usage:
-    from src.biosciences_temporal.agents.cq14 import CQ14Orchestrator
+    from biosciences_temporal.agents.cq14 import CQ14Orchestrator
 
     orchestrator = CQ14Orchestrator(gene_a="TP53", gene_b="TYMS")
     result = await orchestrator.run()
 """
 
-import json
-from dataclasses import dataclass, field
+import asyncio
 from typing import Optional
 
+import logfire
+from pydantic import BaseModel, Field
+
 from .models import (
     ClinicalTrial,
     DrugCandidate,
@@ -28,11 +30,10 @@ from .enrich import enrich_protein
 from .expand import expand_interactions
 from .drugs import find_drugs
 from .trials import search_trials
-from .validate import validate_gene, validate_drug, validate_synthetic_lethality
+from .validate import precheck_synthetic_lethality, validate_batch
 
 
-@dataclass
-class CQ14Result:
+class CQ14Result(BaseModel):
     """Complete CQ14 workflow result."""
 
     # Phase 1: Anchor
@@ -44,31 +45,18 @@ class CQ14Result:
     gene_b_function: Optional[ProteinFunction] = None
 
     # Phase 3: Expand
-    interactions: list[GeneInteraction] = field(default_factory=list)
+    interactions: list[GeneInteraction] = Field(default_factory=list)
 
     # Phase 4: Traverse
-    drugs: list[DrugCandidate] = field(default_factory=list)
-    trials: list[ClinicalTrial] = field(default_factory=list)
+    drugs: list[DrugCandidate] = Field(default_factory=list)
+    trials: list[ClinicalTrial] = Field(default_factory=list)
 
     # Phase 5: Validate
-    validations: list[ValidationEvidence] = field(default_factory=list)
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "gene_a": self.gene_a.model_dump() if self.gene_a else None,
-            "gene_b": self.gene_b.model_dump() if self.gene_b else None,
-            "gene_a_function": self.gene_a_function.model_dump() if self.gene_a_function else None,
-            "gene_b_function": self.gene_b_function.model_dump() if self.gene_b_function else None,
-            "interactions": [i.model_dump() for i in self.interactions],
-            "drugs": [d.model_dump() for d in self.drugs],
-            "trials": [t.model_dump() for t in self.trials],
-            "validations": [v.model_dump() for v in self.validations],
-        }
+    validations: list[ValidationEvidence] = Field(default_factory=list)
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return self.model_dump_json(indent=2)
 
 
 class CQ14Orchestrator:
@@ -84,101 +72,157 @@ class CQ14Orchestrator:
         self.gene_a = gene_a
         self.gene_b = gene_b
         self.result = CQ14Result()
+        self._tasks: dict[str, asyncio.Task] = {}
 
     async def run(self) -> CQ14Result:
         """Execute the complete CQ14 workflow."""
-        print(f"\n{'='*60}")
-        print(f"CQ14 Synthetic Lethality Validation: {self.gene_a}-{self.gene_b}")
-        print(f"{'='*60}")
+        logfire.info(
+            "CQ14 synthetic lethality validation: {gene_a}-{gene_b}",
+            gene_a=self.gene_a,
+            gene_b=self.gene_b,
+        )
 
         await self.phase1_anchor()
         await self.phase2_enrich()
-        await self.phase3_expand()
-        await self.phase4_traverse()
-        await self.phase5_validate()
+
+        # Phases 3-5 form a DAG rather than a pipeline: expansion runs
+        # alongside the drug search, and trial search and validation
+        # each start as soon as the drug results arrive.
+        self._drugs_task()
+        await asyncio.gather(
+            self.phase3_expand(),
+            self.phase4_traverse(),
+            self.phase5_validate(),
+        )
 
         return self.result
 
-    async def phase1_anchor(self):
-        """Phase 1: Resolve gene symbols to canonical identifiers."""
-        print("\n--- Phase 1: Anchor ---")
+    @property
+    def target_name(self) -> str:
+        """Human-readable drug target name for gene_b."""
+        return "thymidylate synthase" if self.gene_b == "TYMS" else self.gene_b
 
-        print(f"Resolving {self.gene_a}...")
-        self.result.gene_a = await resolve_gene(self.gene_a)
-        print(f"  → {self.result.gene_a.hgnc_id}: {self.result.gene_a.name}")
+    def _drugs_task(self) -> asyncio.Task:
+        """Start the drug search once; phases 4 and 5 both await it."""
+        if "drugs" not in self._tasks:
+            self._tasks["drugs"] = asyncio.create_task(find_drugs(self.target_name))
+        return self._tasks["drugs"]
 
-        print(f"Resolving {self.gene_b}...")
-        self.result.gene_b = await resolve_gene(self.gene_b)
-        print(f"  → {self.result.gene_b.hgnc_id}: {self.result.gene_b.name}")
+    async def phase1_anchor(self):
+        """Phase 1: Resolve gene symbols to canonical identifiers."""
+        logfire.info("Phase 1: Anchor", phase="anchor", genes=[self.gene_a, self.gene_b])
+        results = await asyncio.gather(
+            resolve_gene(self.gene_a),
+            resolve_gene(self.gene_b),
+            return_exceptions=True,
+        )
+
+        for symbol, gene in zip((self.gene_a, self.gene_b), results):
+            if isinstance(gene, BaseException):
+                logfire.warn("Resolution failed for {gene}", phase="anchor", gene=symbol, error=str(gene))
+            else:
+                logfire.info(
+                    "Resolved {gene} → {hgnc_id}",
+                    phase="anchor", gene=symbol, hgnc_id=gene.hgnc_id, name=gene.name,
+                )
+
+        self.result.gene_a, self.result.gene_b = (
+            None if isinstance(gene, BaseException) else gene for gene in results
+        )
 
     async def phase2_enrich(self):
         """Phase 2: Get protein functional context."""
-        print("\n--- Phase 2: Enrich ---")
-
+        # Build (attribute, symbol, coroutine) only for genes with a UniProt ID
+        pending = []
         if self.result.gene_a and self.result.gene_a.uniprot_id:
-            print(f"Getting protein context for {self.gene_a}...")
-            self.result.gene_a_function = await enrich_protein(self.result.gene_a.uniprot_id)
-            print(f"  → {self.result.gene_a_function.function_summary[:100]}...")
-
+            pending.append(("gene_a_function", self.gene_a, enrich_protein(self.result.gene_a.uniprot_id)))
         if self.result.gene_b and self.result.gene_b.uniprot_id:
-            print(f"Getting protein context for {self.gene_b}...")
-            self.result.gene_b_function = await enrich_protein(self.result.gene_b.uniprot_id)
-            print(f"  → {self.result.gene_b_function.function_summary[:100]}...")
+            pending.append(("gene_b_function", self.gene_b, enrich_protein(self.result.gene_b.uniprot_id)))
+
+        logfire.info("Phase 2: Enrich", phase="enrich", genes=[symbol for _, symbol, _ in pending])
+        if not pending:
+            return
+
+        results = await asyncio.gather(*(coro for _, _, coro in pending), return_exceptions=True)
+
+        for (attr, symbol, _), function in zip(pending, results):
+            if isinstance(function, BaseException):
+                logfire.warn("Enrichment failed for {gene}", phase="enrich", gene=symbol, error=str(function))
+                continue
+            setattr(self.result, attr, function)
+            logfire.info(
+                "Enriched {gene}",
+                phase="enrich", gene=symbol, summary=function.function_summary[:100],
+            )
 
     async def phase3_expand(self):
         """Phase 3: Find protein-protein and genetic interactions."""
-        print("\n--- Phase 3: Expand ---")
-
-        print(f"Finding interactions for {self.gene_b}...")
+        logfire.info("Phase 3: Expand", phase="expand", gene=self.gene_b)
         self.result.interactions = await expand_interactions(self.gene_b)
-        print(f"  → Found {len(self.result.interactions)} interactions")
-
-        for interaction in self.result.interactions[:5]:
-            print(f"    - {interaction.partner_gene}: {interaction.interaction_type} ({interaction.evidence_source})")
+        logfire.info(
+            "Found {count} interactions for {gene}",
+            phase="expand",
+            gene=self.gene_b,
+            count=len(self.result.interactions),
+            top=[
+                f"{i.partner_gene}: {i.interaction_type} ({i.evidence_source})"
+                for i in self.result.interactions[:5]
+            ],
+        )
 
     async def phase4_traverse(self):
         """Phase 4: Find drugs and clinical trials."""
-        print("\n--- Phase 4: Traverse ---")
-
         # Phase 4a: Find drugs
-        target_name = "thymidylate synthase" if self.gene_b == "TYMS" else self.gene_b
-        print(f"Finding drugs targeting {target_name}...")
-        self.result.drugs = await find_drugs(target_name)
-        print(f"  → Found {len(self.result.drugs)} drugs")
-
-        for drug in self.result.drugs[:3]:
-            print(f"    - {drug.name} ({drug.chembl_id}): {drug.mechanism}, Phase {drug.max_phase}")
+        logfire.info("Phase 4: Traverse", phase="traverse", target=self.target_name)
+        self.result.drugs = await self._drugs_task()
+        logfire.info(
+            "Found {count} drugs targeting {target}",
+            phase="traverse",
+            target=self.target_name,
+            count=len(self.result.drugs),
+            top=[
+                f"{d.name} ({d.chembl_id}): {d.mechanism}, Phase {d.max_phase}"
+                for d in self.result.drugs[:3]
+            ],
+        )
 
         # Phase 4b: Find trials using discovered drug names
         if self.result.drugs:
             drug_name = self.result.drugs[0].name
-            print(f"Finding trials for {drug_name}...")
             self.result.trials = await search_trials(drug_name)
-            print(f"  → Found {len(self.result.trials)} trials")
-
-            for trial in self.result.trials[:3]:
-                print(f"    - {trial.nct_id}: {trial.title[:50]}... ({trial.phase})")
+            logfire.info(
+                "Found {count} trials for {drug}",
+                phase="traverse",
+                drug=drug_name,
+                count=len(self.result.trials),
+                top=[f"{t.nct_id}: {t.title[:50]} ({t.phase})" for t in self.result.trials[:3]],
+            )
         else:
-            print("  No drugs found, skipping trial search")
+            logfire.info("No drugs found, skipping trial search", phase="traverse")
 
     async def phase5_validate(self):
         """Phase 5: Validate claims against source databases."""
-        print("\n--- Phase 5: Validate ---")
-
-        # Validate synthetic lethality claim
-        print(f"Validating synthetic lethality: {self.gene_a}-{self.gene_b}...")
-        sl_result = await validate_synthetic_lethality(self.gene_a, self.gene_b)
-        self.result.validations.append(sl_result)
-        status = "✓" if sl_result.verified else "✗"
-        print(f"  {status} {sl_result.claim}")
-
-        # Validate first drug
-        if self.result.drugs:
-            drug = self.result.drugs[0]
-            print(f"Validating drug: {drug.name}...")
-            drug_result = await validate_drug(
-                f"{drug.name} ({drug.chembl_id}) targets {drug.target_name}"
+        # Validate the SL claim and first drug in one batched agent run; an
+        # SL pair absent from the BioGRID snapshot is answered without it
+        validations: list[ValidationEvidence] = []
+        claims = []
+        if sl_evidence := precheck_synthetic_lethality(self.gene_a, self.gene_b):
+            validations.append(sl_evidence)
+        else:
+            claims.append(("sl", f"{self.gene_a}-{self.gene_b}"))
+        drugs = await self._drugs_task()
+        if drugs:
+            drug = drugs[0]
+            claims.append(("drug", f"{drug.name} ({drug.chembl_id}) targets {drug.target_name}"))
+
+        logfire.info("Phase 5: Validate", phase="validate", claims=[c for _, c in claims])
+        validations.extend(await validate_batch(claims))
+        for evidence in validations:
+            self.result.validations.append(evidence)
+            logfire.info(
+                "{status} {claim}",
+                phase="validate",
+                status="✓" if evidence.verified else "✗",
+                claim=evidence.claim,
+                verified=evidence.verified,
             )
-            self.result.validations.append(drug_result)
-            status = "✓" if drug_result.verified else "✗"
-            print(f"  {status} {drug_result.claim}")
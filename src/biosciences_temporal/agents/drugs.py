@@ -4,7 +4,7 @@ Drug discovery agent - Phase 4a: Traverse (Drugs).
 Finds drugs targeting a protein using ChEMBL.
 """
 
-from .base import AgentMetadata, AgentRunner
+from .base import AgentMetadata, AgentRunner, USAGE_LIMITS
 from .models import DrugCandidate
 
 INSTRUCTIONS = """
@@ -32,6 +32,7 @@ _runner = AgentRunner(
         entity_type="compound",
         source="ChEMBL",
     ),
+    usage_limits=USAGE_LIMITS,
 )
 
 
@@ -4,7 +4,7 @@ Protein enrichment agent - Phase 2: Enrich.
 Gets protein functional context from UniProt.
 """
 
-from .base import AgentMetadata, AgentRunner
+from .base import AgentMetadata, AgentRunner, USAGE_LIMITS_SIMPLE, agent_cache
 from .models import ProteinFunction
 
 INSTRUCTIONS = """
@@ -26,12 +26,24 @@ _runner = AgentRunner(
         entity_type="protein",
         source="UniProt",
     ),
+    usage_limits=USAGE_LIMITS_SIMPLE,
 )
 
 
+def _uniprot_curie(uniprot_id: str) -> str:
+    """Normalize a UniProt accession to CURIE format."""
+    uniprot_id = uniprot_id.strip()
+    if not uniprot_id.startswith("UniProtKB:"):
+        uniprot_id = f"UniProtKB:{uniprot_id}"
+    return uniprot_id
+
+
+@agent_cache(key=lambda uniprot_id, cq_id="cq14": _uniprot_curie(uniprot_id), ttl=24 * 3600)
 async def enrich_protein(uniprot_id: str, cq_id: str = "cq14") -> ProteinFunction:
     """Get protein functional context.
 
+    Results are cached by UniProt CURIE; accessions are stable.
+
     Args:
         uniprot_id: UniProt accession (e.g., "UniProtKB:P04637" or just "P04637")
         cq_id: Competency question identifier for Logfire attribution
@@ -39,8 +51,6 @@ async def enrich_protein(uniprot_id: str, cq_id: str = "cq14") -> ProteinFunctio
     Returns:
         ProteinFunction with function summary and keywords.
     """
-    # Ensure CURIE format
-    if not uniprot_id.startswith("UniProtKB:"):
-        uniprot_id = f"UniProtKB:{uniprot_id}"
-
-    return await _runner.run(f"Get protein function for {uniprot_id}", cq_id=cq_id)
+    return await _runner.run(
+        f"Get protein function for {_uniprot_curie(uniprot_id)}", cq_id=cq_id
+    )
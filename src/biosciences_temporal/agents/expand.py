@@ -4,7 +4,7 @@ Interaction expansion agent - Phase 3: Expand.
 Finds protein-protein and genetic interactions using STRING and BioGRID.
 """
 
-from .base import AgentMetadata, AgentRunner
+from .base import AgentMetadata, AgentRunner, USAGE_LIMITS
 from .models import GeneInteraction
 
 INSTRUCTIONS = """
@@ -31,6 +31,7 @@ _runner = AgentRunner(
         entity_type="interaction",
         source="STRING,BioGRID",
     ),
+    usage_limits=USAGE_LIMITS,
 )
 
 
@@ -2,17 +2,23 @@
 Shared Pydantic models for CQ14 agents.
 
 These models define the structured outputs from each phase of the
-Fuzzy-to-Fact protocol.
+Fuzzy-to-Fact protocol. They are frozen: cached agent results are shared
+between callers and must not be mutated in place.
 """
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+
+class _FrozenModel(BaseModel):
+    """Base for immutable phase outputs."""
+    model_config = ConfigDict(frozen=True)
 
 
 # --- Phase 1: Anchor ---
 
-class GeneInfo(BaseModel):
+class GeneInfo(_FrozenModel):
     """Resolved gene information from HGNC."""
     hgnc_id: str
     symbol: str
@@ -24,7 +30,7 @@ class GeneInfo(BaseModel):
 
 # --- Phase 2: Enrich ---
 
-class ProteinFunction(BaseModel):
+class ProteinFunction(_FrozenModel):
     """Protein functional context from UniProt."""
     uniprot_id: str
     function_summary: str
@@ -33,7 +39,7 @@ class ProteinFunction(BaseModel):
 
 # --- Phase 3: Expand ---
 
-class GeneInteraction(BaseModel):
+class GeneInteraction(_FrozenModel):
     """Gene-gene or protein-protein interaction."""
     partner_gene: str
     interaction_type: str  # physical, genetic, negative_genetic
@@ -44,7 +50,7 @@ class GeneInteraction(BaseModel):
 
 # --- Phase 4: Traverse ---
 
-class DrugCandidate(BaseModel):
+class DrugCandidate(_FrozenModel):
     """Drug candidate from ChEMBL."""
     chembl_id: str
     name: str
@@ -53,7 +59,7 @@ class DrugCandidate(BaseModel):
     max_phase: int  # 0-4, 4 = approved
 
 
-class ClinicalTrial(BaseModel):
+class ClinicalTrial(_FrozenModel):
     """Clinical trial from ClinicalTrials.gov."""
     nct_id: str
     title: str
@@ -65,7 +71,7 @@ class ClinicalTrial(BaseModel):
 
 # --- Phase 5: Validate ---
 
-class ValidationEvidence(BaseModel):
+class ValidationEvidence(_FrozenModel):
     """Validation evidence for a claim."""
     claim: str
     verified: bool
@@ -4,7 +4,7 @@ Gene resolution agent - Phase 1: Anchor.
 Resolves gene symbols to canonical HGNC identifiers with cross-references.
 """
 
-from .base import AgentMetadata, AgentRunner
+from .base import AgentMetadata, AgentRunner, USAGE_LIMITS_SIMPLE, agent_cache
 from .models import GeneInfo
 
 INSTRUCTIONS = """
@@ -28,12 +28,16 @@ _runner = AgentRunner(
         entity_type="gene",
         source="HGNC",
     ),
+    usage_limits=USAGE_LIMITS_SIMPLE,
 )
 
 
+@agent_cache(key=lambda gene_symbol, cq_id="cq14": gene_symbol.strip().upper(), ttl=24 * 3600)
 async def resolve_gene(gene_symbol: str, cq_id: str = "cq14") -> GeneInfo:
     """Resolve a gene symbol to canonical HGNC identifiers.
 
+    Results are cached by upper-cased symbol; HGNC identifiers are stable.
+
     Args:
         gene_symbol: Gene symbol to resolve (e.g., "TP53", "TYMS")
         cq_id: Competency question identifier for Logfire attribution
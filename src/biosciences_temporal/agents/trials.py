@@ -4,7 +4,7 @@ Clinical trials agent - Phase 4b: Traverse (Trials).
 Searches clinical trials for drugs using ClinicalTrials.gov.
 """
 
-from .base import AgentMetadata, AgentRunner
+from .base import AgentMetadata, AgentRunner, USAGE_LIMITS_SIMPLE
 from .models import ClinicalTrial
 
 INSTRUCTIONS = """
@@ -30,6 +30,7 @@ _runner = AgentRunner(
         entity_type="trial",
         source="ClinicalTrials.gov",
     ),
+    usage_limits=USAGE_LIMITS_SIMPLE,
 )
 
 
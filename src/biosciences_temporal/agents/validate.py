@@ -4,7 +4,12 @@ Validation agents - Phase 5: Validate.
 Validates claims against source databases.
 """
 
-from .base import AgentMetadata, AgentRunner
+import asyncio
+import csv
+import os
+from collections.abc import Sequence
+
+from .base import AgentMetadata, AgentRunner, USAGE_LIMITS, USAGE_LIMITS_SIMPLE, agent_cache
 from .models import ValidationEvidence
 
 # --- Agent Instructions ---
@@ -45,7 +50,28 @@ IMPORTANT: When calling biogrid_get_interactions, always set max_results=100 to
 If no direct evidence is found, report verified=False with explanation.
 """
 
+BATCH_VALIDATION_INSTRUCTIONS = """
+Validate a batch of independent claims. Each claim is tagged "[i] kind: claim".
+
+Handle each kind like its single-claim validator:
+- gene: Use hgnc_get_gene and check that cross-references match claimed values
+- drug: Use chembl_get_compound with the ChEMBL ID; verify the ID exists and
+  the name matches approximately; include max_phase in evidence if available
+- trial: Use clinicaltrials_get_trial with the NCT ID; confirm the trial exists
+- sl: Use biogrid_get_interactions with max_results=100 and look for Negative
+  Genetic interactions between the two genes; report supporting PubMed IDs
+
+Call tools for different claims in parallel where possible.
+
+Return exactly one result per claim, in index order, with claim set to the
+original claim text. Report verified=False with an explanation when no
+evidence is found.
+"""
+
 # --- Agent Runners ---
+# Each runner's instructions form a fixed system prefix; validators send only
+# the claim as the user message so the cacheable prefix ends at that boundary.
+# Each validator is offered only the tools its instructions name.
 
 _gene_runner = AgentRunner(
     output_type=ValidationEvidence,
@@ -57,6 +83,8 @@ _gene_runner = AgentRunner(
         entity_type="gene",
         source="HGNC",
     ),
+    usage_limits=USAGE_LIMITS_SIMPLE,
+    tools=frozenset({"hgnc_get_gene"}),
 )
 
 _drug_runner = AgentRunner(
@@ -69,6 +97,8 @@ _drug_runner = AgentRunner(
         entity_type="compound",
         source="ChEMBL",
     ),
+    usage_limits=USAGE_LIMITS_SIMPLE,
+    tools=frozenset({"chembl_get_compound"}),
 )
 
 _trial_runner = AgentRunner(
@@ -81,6 +111,8 @@ _trial_runner = AgentRunner(
         entity_type="trial",
         source="ClinicalTrials.gov",
     ),
+    usage_limits=USAGE_LIMITS_SIMPLE,
+    tools=frozenset({"clinicaltrials_get_trial"}),
 )
 
 _sl_runner = AgentRunner(
@@ -93,11 +125,118 @@ _sl_runner = AgentRunner(
         entity_type="gene_pair",
         source="BioGRID",
     ),
+    usage_limits=USAGE_LIMITS,
+    tools=frozenset({"biogrid_get_interactions"}),
+)
+
+
+_batch_runner = AgentRunner(
+    output_type=list[ValidationEvidence],
+    instructions=BATCH_VALIDATION_INSTRUCTIONS,
+    name="validate_batch",
+    metadata=AgentMetadata(
+        phase="validate",
+        action="batch",
+        entity_type="claim",
+        source="HGNC,ChEMBL,ClinicalTrials.gov,BioGRID",
+    ),
+    usage_limits=USAGE_LIMITS,
+    tools=frozenset({
+        "hgnc_get_gene",
+        "chembl_get_compound",
+        "clinicaltrials_get_trial",
+        "biogrid_get_interactions",
+    }),
 )
 
 
+# Caps concurrent validator runs when fanned out via validate_all
+_VALIDATE_SEM = asyncio.Semaphore(5)
+
+
+async def _run_bounded(
+    runner: AgentRunner[ValidationEvidence], prompt: str, cq_id: str
+) -> ValidationEvidence:
+    """Run a validator under the shared concurrency limit."""
+    async with _VALIDATE_SEM:
+        return await runner.run(prompt, cq_id=cq_id)
+
+
+# Repeat validations within this window (e.g., a rerun or resumed workflow)
+# reuse the earlier result; concurrent duplicates share one run and one
+# semaphore slot
+_VALIDATION_TTL = 60.0
+
+
+# --- BioGRID Precheck ---
+
+def _pair(gene_a: str, gene_b: str) -> tuple[str, str]:
+    """Order-independent key for a gene pair."""
+    a, b = gene_a.strip().upper(), gene_b.strip().upper()
+    return (a, b) if a <= b else (b, a)
+
+
+def _load_negative_genetic_pairs() -> frozenset[tuple[str, str]] | None:
+    """Load gene pairs with Negative Genetic interactions from a BioGRID snapshot.
+
+    Reads the BioGRID TAB3 file named by BIOGRID_NEGATIVE_GENETIC_SNAPSHOT
+    (e.g., BIOGRID-ORGANISM-Homo_sapiens-4.4.x.tab3.txt).
+
+    Returns:
+        Canonical gene pairs, or None when no snapshot is configured.
+
+    Raises:
+        ValueError: If the snapshot is empty or lacks a TAB3 header.
+    """
+    path = os.environ.get("BIOGRID_NEGATIVE_GENETIC_SNAPSHOT")
+    if not path:
+        return None
+
+    pairs: set[tuple[str, str]] = set()
+    with open(path, newline="") as f:
+        reader = csv.reader(f, delimiter="\t")
+        header = [name.lstrip("#") for name in next(reader, [])]
+        try:
+            col_a = header.index("Official Symbol Interactor A")
+            col_b = header.index("Official Symbol Interactor B")
+            col_system = header.index("Experimental System")
+        except ValueError:
+            raise ValueError(f"{path}: not a BioGRID TAB3 file (missing header columns)") from None
+        width = max(col_a, col_b, col_system) + 1
+        for row in reader:
+            # Skip truncated rows (e.g., a cut-off last line)
+            if len(row) >= width and row[col_system] == "Negative Genetic":
+                pairs.add(_pair(row[col_a], row[col_b]))
+    return frozenset(pairs)
+
+
+# Loaded once at import (worker startup); None disables the precheck
+_NEGATIVE_GENETIC_PAIRS = _load_negative_genetic_pairs()
+
+
+def precheck_synthetic_lethality(gene_a: str, gene_b: str) -> ValidationEvidence | None:
+    """Answer a synthetic lethality claim from the BioGRID snapshot, if possible.
+
+    Most pairs have no Negative Genetic interaction on record; those are
+    answered without an agent run.
+
+    Returns:
+        Unverified evidence for a pair absent from the snapshot, or None
+        when the claim needs an agent run (pair on record, or no snapshot).
+    """
+    if _NEGATIVE_GENETIC_PAIRS is None or _pair(gene_a, gene_b) in _NEGATIVE_GENETIC_PAIRS:
+        return None
+    return ValidationEvidence(
+        claim=f"{gene_a} and {gene_b}",
+        verified=False,
+        evidence_source="BioGRID",
+        evidence_details="No BioGRID Negative Genetic interactions on record",
+    )
+
+
 # --- Validation Functions ---
 
+@agent_cache(key=lambda claim, cq_id="cq14": (claim.strip(), cq_id), ttl=_VALIDATION_TTL)
 async def validate_gene(claim: str, cq_id: str = "cq14") -> ValidationEvidence:
     """Validate gene identifiers against HGNC.
 
@@ -108,9 +247,10 @@ async def validate_gene(claim: str, cq_id: str = "cq14") -> ValidationEvidence:
     Returns:
         ValidationEvidence with verification result.
     """
-    return await _gene_runner.run(f"Validate: {claim}", cq_id=cq_id)
+    return await _run_bounded(_gene_runner, claim, cq_id)
 
 
+@agent_cache(key=lambda claim, cq_id="cq14": (claim.strip(), cq_id), ttl=_VALIDATION_TTL)
 async def validate_drug(claim: str, cq_id: str = "cq14") -> ValidationEvidence:
     """Validate drug/compound against ChEMBL.
 
@@ -121,9 +261,10 @@ async def validate_drug(claim: str, cq_id: str = "cq14") -> ValidationEvidence:
     Returns:
         ValidationEvidence with verification result.
     """
-    return await _drug_runner.run(f"Validate compound: {claim}", cq_id=cq_id)
+    return await _run_bounded(_drug_runner, claim, cq_id)
 
 
+@agent_cache(key=lambda nct_id, cq_id="cq14": (nct_id.strip().upper(), cq_id), ttl=_VALIDATION_TTL)
 async def validate_trial(nct_id: str, cq_id: str = "cq14") -> ValidationEvidence:
     """Validate clinical trial exists in ClinicalTrials.gov.
 
@@ -134,9 +275,13 @@ async def validate_trial(nct_id: str, cq_id: str = "cq14") -> ValidationEvidence
     Returns:
         ValidationEvidence with verification result.
     """
-    return await _trial_runner.run(f"Validate clinical trial: {nct_id}", cq_id=cq_id)
+    return await _run_bounded(_trial_runner, nct_id, cq_id)
 
 
+@agent_cache(
+    key=lambda gene_a, gene_b, cq_id="cq14": (gene_a.strip().upper(), gene_b.strip().upper(), cq_id),
+    ttl=_VALIDATION_TTL,
+)
 async def validate_synthetic_lethality(
     gene_a: str, gene_b: str, cq_id: str = "cq14"
 ) -> ValidationEvidence:
@@ -150,7 +295,66 @@ async def validate_synthetic_lethality(
     Returns:
         ValidationEvidence with verification result and PubMed references.
     """
-    return await _sl_runner.run(
-        f"Check synthetic lethality between {gene_a} and {gene_b}",
-        cq_id=cq_id,
+    if evidence := precheck_synthetic_lethality(gene_a, gene_b):
+        return evidence
+    return await _run_bounded(_sl_runner, f"{gene_a} and {gene_b}", cq_id)
+
+
+async def validate_batch(
+    items: Sequence[tuple[str, str]], cq_id: str = "cq14"
+) -> list[ValidationEvidence]:
+    """Validate several claims in a single agent run.
+
+    One LLM round-trip serves every claim; the model can call the tools
+    for each claim in parallel.
+
+    Args:
+        items: (kind, claim) pairs, kind one of gene, drug, trial or sl
+            (e.g., [("sl", "TP53-TYMS"),
+            ("drug", "Fluorouracil (CHEMBL:185) targets thymidylate synthase")])
+        cq_id: Competency question identifier for Logfire attribution
+
+    Returns:
+        One ValidationEvidence per item, in input order.
+    """
+    if not items:
+        return []
+    prompt = "\n\n".join(f"[{i}] {kind}: {claim}" for i, (kind, claim) in enumerate(items))
+    return await _batch_runner.run(prompt, cq_id=cq_id)
+
+
+# Claim kind -> validator; validate_all items are (kind, *args)
+_VALIDATORS = {
+    "gene": validate_gene,
+    "drug": validate_drug,
+    "trial": validate_trial,
+    "sl": validate_synthetic_lethality,
+}
+
+
+async def validate_all(
+    items: Sequence[tuple[str, ...]], cq_id: str = "cq14"
+) -> list[ValidationEvidence | BaseException]:
+    """Run independent validations concurrently.
+
+    Each item is a claim kind followed by the validator's arguments, e.g.
+    ("gene", "TP53: HGNC=HGNC:11998"), ("trial", "NCT:00461032") or
+    ("sl", "TP53", "TYMS"). At most five validators run at once.
+
+    Args:
+        items: Claims to validate, as (kind, *args) tuples
+        cq_id: Competency question identifier for Logfire attribution
+
+    Returns:
+        One ValidationEvidence per item in input order, or the exception
+        raised by that validator.
+
+    Raises:
+        KeyError: If an item has an unknown kind.
+    """
+    # Look up every kind first so a bad item doesn't leave coroutines unawaited
+    validators = [(_VALIDATORS[kind], args) for kind, *args in items]
+    return await asyncio.gather(
+        *(validator(*args, cq_id=cq_id) for validator, args in validators),
+        return_exceptions=True,
     )
@@ -1,27 +1,47 @@
 """
 Configuration for CQ14 Temporal workflow.
 
-Provides activity configurations, retry policies, and constants.
+Provides activity configurations, retry policies, connection settings,
+and constants.
 """
 
 from .timeouts import (
+    API_CONFIG,
+    ActivityConfig,
+    IO_TASK_QUEUE,
     LONG_ACTIVITY_CONFIG,
+    SEARCH_CONFIG,
     SHORT_ACTIVITY_CONFIG,
     TASK_QUEUE,
+    VALIDATOR_CONFIG,
 )
+from .connection import TEMPORAL_ADDRESS
 from .retry_policies import (
+    API_RETRY,
     LONG_ACTIVITY_RETRY,
     NON_RETRYABLE_ERRORS,
+    SEARCH_RETRY,
     SHORT_ACTIVITY_RETRY,
+    VALIDATOR_RETRY,
 )
 
 __all__ = [
     # Activity configs
+    "ActivityConfig",
     "SHORT_ACTIVITY_CONFIG",
     "LONG_ACTIVITY_CONFIG",
+    "VALIDATOR_CONFIG",
+    "API_CONFIG",
+    "SEARCH_CONFIG",
     "TASK_QUEUE",
+    "IO_TASK_QUEUE",
+    # Connection
+    "TEMPORAL_ADDRESS",
     # Retry policies
     "SHORT_ACTIVITY_RETRY",
     "LONG_ACTIVITY_RETRY",
+    "VALIDATOR_RETRY",
+    "API_RETRY",
+    "SEARCH_RETRY",
     "NON_RETRYABLE_ERRORS",
 ]
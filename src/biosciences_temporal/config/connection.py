@@ -0,0 +1,11 @@
+"""
+Temporal connection settings for CQ14 workflow.
+
+Read once from the environment; shared by the worker and the client.
+"""
+
+import os
+
+
+# Temporal frontend address (override for remote servers)
+TEMPORAL_ADDRESS = os.environ.get("TEMPORAL_ADDRESS", "localhost:7233")
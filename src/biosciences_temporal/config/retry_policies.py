@@ -13,14 +13,18 @@ from temporalio.common import RetryPolicy
 
 # ADR-001 Section 9: Non-retryable error codes
 # These errors indicate bad input or missing data - retrying won't help
-NON_RETRYABLE_ERRORS = [
+# Immutable: shared by every policy below
+NON_RETRYABLE_ERRORS: tuple[str, ...] = (
     "UNRESOLVED_ENTITY",   # Raw string passed to strict tool (use search first)
     "AMBIGUOUS_QUERY",     # Query too short or returns >100 results
     "ENTITY_NOT_FOUND",    # Valid CURIE but no record exists
     "ValidationError",     # Pydantic model validation failed
-]
+    "ValueError",          # Malformed input (e.g., bad claim or CURIE format)
+    "KeyError",            # Missing field in an activity payload
+    "TypeError",           # Wrong payload shape; a code bug, not transient
+)
 
-# Short MCP activities (resolve_gene, enrich_protein, validators)
+# Short MCP activities (enrich_protein and other single lookups)
 # Expected duration: 10-60 seconds
 # Retry: Quick retry for transient failures
 SHORT_ACTIVITY_RETRY = RetryPolicy(
@@ -31,7 +35,7 @@ SHORT_ACTIVITY_RETRY = RetryPolicy(
     non_retryable_error_types=NON_RETRYABLE_ERRORS,
 )
 
-# Long MCP activities (expand_interactions, find_drugs, search_trials)
+# Long MCP activities (expand_interactions, find_drugs)
 # Expected duration: 30-180 seconds
 # Retry: More patient retry for complex queries
 LONG_ACTIVITY_RETRY = RetryPolicy(
@@ -41,3 +45,37 @@ LONG_ACTIVITY_RETRY = RetryPolicy(
     maximum_attempts=5,
     non_retryable_error_types=NON_RETRYABLE_ERRORS,
 )
+
+# Per-error-class policies. AgentRunner already retries 429/5xx/timeouts
+# in-process with full-jitter backoff, so Temporal retries here only cover
+# what escapes that loop.
+
+# Validators (validate_all, validate_*): fast and cheap to re-ask
+# Retry: one quick retry so a failure doesn't wait out long backoff
+VALIDATOR_RETRY = RetryPolicy(
+    initial_interval=timedelta(milliseconds=200),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=2),
+    maximum_attempts=2,
+    non_retryable_error_types=NON_RETRYABLE_ERRORS,
+)
+
+# Rate-limited public APIs (resolve_and_enrich: HGNC, UniProt)
+# Retry: capped exponential backoff for provider-transient failures
+API_RETRY = RetryPolicy(
+    initial_interval=timedelta(seconds=1),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=30),
+    maximum_attempts=3,
+    non_retryable_error_types=NON_RETRYABLE_ERRORS,
+)
+
+# Search endpoints (search_trials: ClinicalTrials.gov)
+# Retry: more attempts, same 30s cap; searches fail transiently more often
+SEARCH_RETRY = RetryPolicy(
+    initial_interval=timedelta(seconds=1),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=30),
+    maximum_attempts=5,
+    non_retryable_error_types=NON_RETRYABLE_ERRORS,
+)
@@ -2,33 +2,81 @@
 Activity timeout configuration for CQ14 Temporal workflow.
 
 Defines timeout settings for different activity types.
-These configs are passed to workflow.execute_activity() calls.
+These configs supply the timeout and retry arguments of
+workflow.execute_activity() and workflow.execute_local_activity() calls.
 """
 
+from dataclasses import dataclass
 from datetime import timedelta
 
+from temporalio.common import RetryPolicy
+
 from .retry_policies import (
+    API_RETRY,
     LONG_ACTIVITY_RETRY,
+    SEARCH_RETRY,
     SHORT_ACTIVITY_RETRY,
+    VALIDATOR_RETRY,
 )
 
 
-# Short MCP activities (resolve_gene, enrich_protein, validators)
+# Task queue name
+TASK_QUEUE = "biosciences-task-queue"
+
+# Long-running I/O activities get their own queue and worker so they can
+# run at high concurrency without starving the workflow and short
+# activities of pollers
+IO_TASK_QUEUE = "biosciences-io-task-queue"
+
+
+@dataclass(frozen=True, slots=True)
+class ActivityConfig:
+    """Immutable timeout and retry settings for an activity class."""
+    start_to_close_timeout: timedelta
+    schedule_to_close_timeout: timedelta
+    retry_policy: RetryPolicy
+    task_queue: str | None = None  # None: the workflow's own task queue
+
+
+# Short MCP activities (enrich_protein and other single lookups)
 # 3 min execution timeout, 10 min total including retries
-SHORT_ACTIVITY_CONFIG = {
-    "start_to_close_timeout": timedelta(minutes=3),
-    "schedule_to_close_timeout": timedelta(minutes=10),
-    "retry_policy": SHORT_ACTIVITY_RETRY,
-}
+SHORT_ACTIVITY_CONFIG = ActivityConfig(
+    start_to_close_timeout=timedelta(minutes=3),
+    schedule_to_close_timeout=timedelta(minutes=10),
+    retry_policy=SHORT_ACTIVITY_RETRY,
+)
+
+# Validators, run as local activities (validate_all, validate_*)
+# 3 min execution timeout, 7 min total: two attempts and a short backoff.
+# Local retries happen in the worker and are recorded as markers
+VALIDATOR_CONFIG = ActivityConfig(
+    start_to_close_timeout=timedelta(minutes=3),
+    schedule_to_close_timeout=timedelta(minutes=7),
+    retry_policy=VALIDATOR_RETRY,
+)
 
-# Long MCP activities (expand_interactions, find_drugs, search_trials)
+# Rate-limited public API lookups (resolve_and_enrich)
+# 3 min execution timeout, 10 min total including retries
+API_CONFIG = ActivityConfig(
+    start_to_close_timeout=timedelta(minutes=3),
+    schedule_to_close_timeout=timedelta(minutes=10),
+    retry_policy=API_RETRY,
+)
+
+# Search activities (search_trials)
 # 5 min execution timeout, 20 min total including retries
-# Note: No heartbeat timeout - activities wait for MCP/LLM response
-LONG_ACTIVITY_CONFIG = {
-    "start_to_close_timeout": timedelta(minutes=5),
-    "schedule_to_close_timeout": timedelta(minutes=20),
-    "retry_policy": LONG_ACTIVITY_RETRY,
-}
+SEARCH_CONFIG = ActivityConfig(
+    start_to_close_timeout=timedelta(minutes=5),
+    schedule_to_close_timeout=timedelta(minutes=20),
+    retry_policy=SEARCH_RETRY,
+)
 
-# Task queue name
-TASK_QUEUE = "biosciences-task-queue"
+# Long MCP activities (expand_interactions, find_drugs), on the I/O queue
+# 5 min execution timeout, 20 min total including retries
+# Note: No heartbeat timeout - activities wait for MCP/LLM response
+LONG_ACTIVITY_CONFIG = ActivityConfig(
+    start_to_close_timeout=timedelta(minutes=5),
+    schedule_to_close_timeout=timedelta(minutes=20),
+    retry_policy=LONG_ACTIVITY_RETRY,
+    task_queue=IO_TASK_QUEUE,
+)
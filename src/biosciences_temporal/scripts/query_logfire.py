@@ -8,76 +8,129 @@ Usage:
     # Get a read token from Logfire web UI (Project Settings > Read Tokens)
     export LOGFIRE_READ_TOKEN=your_read_token
 
-    uv run python -m src.biosciences_temporal.scripts.query_logfire
-    uv run python -m src.biosciences_temporal.scripts.query_logfire --limit 20
-    uv run python -m src.biosciences_temporal.scripts.query_logfire --sql "SELECT * FROM records WHERE span_name LIKE '%agent%' LIMIT 5"
+    uv run query-logfire
+    uv run query-logfire --limit 20
+    uv run query-logfire --sql "SELECT * FROM records WHERE span_name LIKE '%agent%' LIMIT 5"
 """
 
 import argparse
-import json
 import os
 import sys
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
-from logfire.query_client import LogfireQueryClient
+from pydantic_core import to_json
+
+if TYPE_CHECKING:
+    from logfire.query_client import LogfireQueryClient
 
 load_dotenv()
 
 
-def get_recent_traces(client: LogfireQueryClient, limit: int = 10) -> list:
-    """Get most recent traces."""
-    query = f"""
-    SELECT
-        start_timestamp,
-        span_name,
-        kind,
-        duration,
-        attributes
-    FROM records
-    ORDER BY start_timestamp DESC
-    LIMIT {limit}
-    """
-    return client.query_json_rows(sql=query)
+# Rows fetched per query; results are printed page by page as they arrive
+PAGE_SIZE = 100
+
+
+def _rows(results) -> list:
+    """Extract rows from a RowQueryResults dict (lists pass through)."""
+    return results.get("rows", results) if isinstance(results, dict) else results
+
+
+def _sql_str(value) -> str:
+    """Quote a value as a SQL string literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
 
+def iter_query(
+    client: "LogfireQueryClient",
+    columns: str,
+    where: str,
+    limit: int,
+    page_size: int = PAGE_SIZE,
+) -> Iterator[dict]:
+    """Yield up to limit rows of records, newest first, in keyset pages.
 
-def get_llm_calls(client: LogfireQueryClient, limit: int = 10) -> list:
-    """Get recent LLM/model calls."""
-    query = f"""
+    Each page resumes strictly below the last row seen, ordered by
+    (start_timestamp, span_id), so spans written between fetches can't
+    shift pages into duplicates or gaps, and the backend never re-sorts
+    rows it has already returned.
+
+    Args:
+        client: Logfire query client.
+        columns: SELECT list; span_id is added for the cursor.
+        where: Filter condition, or "TRUE" for all records.
+        limit: Maximum rows to yield.
+        page_size: Rows fetched per query.
+    """
+    cursor = ""
+    remaining = limit
+    while remaining > 0:
+        size = min(page_size, remaining)
+        sql = f"""
     SELECT
-        start_timestamp,
-        span_name,
-        duration,
-        attributes
+        {columns},
+        span_id
     FROM records
-    WHERE span_name LIKE '%chat%'
-       OR span_name LIKE '%model%'
-       OR span_name LIKE '%openai%'
-    ORDER BY start_timestamp DESC
-    LIMIT {limit}
+    WHERE ({where}){cursor}
+    ORDER BY start_timestamp DESC, span_id DESC
+    LIMIT {size}"""
+        rows = _rows(client.query_json_rows(sql=sql))
+        yield from rows
+        if len(rows) < size:
+            return
+        remaining -= size
+
+        last_ts, last_id = _sql_str(rows[-1]["start_timestamp"]), _sql_str(rows[-1]["span_id"])
+        cursor = (
+            f"\n      AND (start_timestamp < {last_ts}"
+            f" OR (start_timestamp = {last_ts} AND span_id < {last_id}))"
+        )
+
+
+def get_recent_traces(client: "LogfireQueryClient", limit: int = 10) -> Iterator[dict]:
+    """Get most recent traces."""
+    return iter_query(
+        client,
+        "start_timestamp, span_name, kind, duration, attributes",
+        "TRUE",
+        limit,
+    )
+
+
+def get_llm_calls(client: "LogfireQueryClient", limit: int = 10) -> Iterator[dict]:
+    """Get recent LLM/model calls.
+
+    Matches the "chat {model}" spans pydantic-ai emits per model request.
+    Equality and anchored prefixes let the backend prune rows instead of
+    substring-scanning every span name.
     """
-    return client.query_json_rows(sql=query)
+    return iter_query(
+        client,
+        "start_timestamp, span_name, duration, attributes",
+        "otel_scope_name = 'pydantic-ai' AND span_name LIKE 'chat %'",
+        limit,
+    )
 
 
-def get_agent_runs(client: LogfireQueryClient, limit: int = 10) -> list:
-    """Get recent agent execution runs."""
-    query = f"""
-    SELECT
-        start_timestamp,
-        span_name,
-        duration,
-        attributes
-    FROM records
-    WHERE span_name LIKE '%agent%'
-       OR span_name LIKE '%Agent%'
-    ORDER BY start_timestamp DESC
-    LIMIT {limit}
+def get_agent_runs(client: "LogfireQueryClient", limit: int = 10) -> Iterator[dict]:
+    """Get recent agent execution runs.
+
+    Matches pydantic-ai's "agent run" span and its newer "invoke_agent {name}"
+    form (instrumentation version 3).
     """
-    return client.query_json_rows(sql=query)
+    return iter_query(
+        client,
+        "start_timestamp, span_name, duration, attributes",
+        "otel_scope_name = 'pydantic-ai'"
+        " AND (span_name = 'agent run' OR span_name LIKE 'invoke_agent %')",
+        limit,
+    )
 
 
-def custom_query(client: LogfireQueryClient, sql: str) -> list:
+def custom_query(client: "LogfireQueryClient", sql: str) -> Iterator[dict]:
     """Run a custom SQL query."""
-    return client.query_json_rows(sql=sql)
+    yield from _rows(client.query_json_rows(sql=sql))
 
 
 def main():
@@ -98,39 +151,48 @@ def main():
         print("Get a read token from Logfire web UI: Project Settings > Read Tokens")
         sys.exit(1)
 
+    # Imported late so --help and missing-token exits stay fast
+    from logfire.query_client import LogfireQueryClient
+
     with LogfireQueryClient(read_token=read_token) as client:
         if args.sql:
-            results = custom_query(client, args.sql)
+            rows = custom_query(client, args.sql)
         elif args.type == "llm":
-            results = get_llm_calls(client, args.limit)
+            rows = get_llm_calls(client, args.limit)
         elif args.type == "agent":
-            results = get_agent_runs(client, args.limit)
+            rows = get_agent_runs(client, args.limit)
         else:
-            results = get_recent_traces(client, args.limit)
+            rows = get_recent_traces(client, args.limit)
 
+        # Rows are printed as each page arrives, never held in full
         if args.format == "json":
-            print(json.dumps(results, indent=2, default=str))
+            # JSON array of rows, written incrementally
+            print("[")
+            for i, record in enumerate(rows):
+                prefix = "," if i else ""
+                print(prefix + to_json(record, indent=2, fallback=str).decode())
+            print("]")
+            return
+
+        count = 0
+        for count, record in enumerate(rows, 1):
+            if count == 1:
+                print("-" * 80)
+            if isinstance(record, dict):
+                print(f"[{count}] {record.get('span_name', 'N/A')}")
+                print(f"    Timestamp: {record.get('start_timestamp', 'N/A')}")
+                if 'duration' in record and record['duration']:
+                    duration_s = record['duration']
+                    print(f"    Duration: {duration_s:.3f}s")
+                print("-" * 80)
+            else:
+                print(f"[{count}] {record}")
+                print("-" * 80)
+
+        if not count:
+            print("No results found.")
         else:
-            # Simple table format - handle RowQueryResults structure
-            rows = results.get("rows", results) if isinstance(results, dict) else results
-            if not rows:
-                print("No results found.")
-                return
-
-            print(f"\nFound {len(rows)} records:\n")
-            print("-" * 80)
-
-            for i, record in enumerate(rows, 1):
-                if isinstance(record, dict):
-                    print(f"[{i}] {record.get('span_name', 'N/A')}")
-                    print(f"    Timestamp: {record.get('start_timestamp', 'N/A')}")
-                    if 'duration' in record and record['duration']:
-                        duration_s = record['duration']
-                        print(f"    Duration: {duration_s:.3f}s")
-                    print("-" * 80)
-                else:
-                    print(f"[{i}] {record}")
-                    print("-" * 80)
+            print(f"\nFound {count} records")
 
 
 if __name__ == "__main__":
@@ -5,27 +5,15 @@ This script runs the PydanticAI agents directly without Temporal durability.
 Useful for testing and development.
 
 Usage:
-    uv run python -m src.biosciences_temporal.scripts.run_agent
-    uv run python -m src.biosciences_temporal.scripts.run_agent --gene-a BRCA1 --gene-b PARP1
+    uv run run-agent
+    uv run run-agent --gene-a BRCA1 --gene-b PARP1
 """
 
-# Configure Logfire before other imports that use Pydantic AI
-import logfire
-
-logfire.configure()
-logfire.instrument_pydantic_ai()
-
 import argparse
 import asyncio
-import json
 import os
 import sys
 
-# Add parent to path for relative imports when running as script
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
-
-from src.biosciences_temporal.agents.cq14 import CQ14Orchestrator
-
 
 def main():
     parser = argparse.ArgumentParser(description="Run CQ14 workflow standalone")
@@ -40,22 +28,39 @@ def main():
         print("Error: OPENAI_API_KEY not set")
         sys.exit(1)
 
+    # Configure Logfire only once inputs are valid (--help and errors skip it),
+    # and before importing the agents so the Pydantic AI patches apply
+    import logfire
+
+    logfire.configure()
+    logfire.instrument_pydantic_ai()
+
+    from biosciences_temporal.agents.base import shutdown_pool
+    from biosciences_temporal.agents.cq14 import CQ14Orchestrator
+
+    async def run():
+        """Run the orchestrator, then stop the pooled MCP subprocesses."""
+        try:
+            return await CQ14Orchestrator(gene_a=args.gene_a, gene_b=args.gene_b).run()
+        finally:
+            await shutdown_pool()
+
     # Run workflow
-    orchestrator = CQ14Orchestrator(gene_a=args.gene_a, gene_b=args.gene_b)
-    result = asyncio.run(orchestrator.run())
+    result = asyncio.run(run())
 
     # Print summary
     print("\n" + "=" * 60)
     print("CQ14 RESULT SUMMARY")
     print("=" * 60)
 
-    result_dict = result.to_dict()
-    print(json.dumps(result_dict, indent=2))
+    # Serialized once by pydantic's Rust serializer, reused for print and file
+    result_json = result.to_json()
+    print(result_json)
 
     # Save to file if requested
     if args.output:
-        with open(args.output, "w") as f:
-            json.dump(result_dict, f, indent=2)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(result_json)
         print(f"\nResults saved to: {args.output}")
 
 
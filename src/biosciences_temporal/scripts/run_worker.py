@@ -5,24 +5,23 @@ This script starts the worker that polls the task queue and executes
 workflows and activities.
 
 Usage:
-    uv run python -m src.biosciences_temporal.scripts.run_worker
+    uv run run-worker
 """
 
-# Configure Logfire before other imports that use Pydantic AI
-import logfire
+import asyncio
 
-logfire.configure()
-logfire.instrument_pydantic_ai()
 
-import asyncio
-import os
-import sys
+def main():
+    # Configure Logfire before importing modules that use Pydantic AI
+    import logfire
+
+    logfire.configure()
+    logfire.instrument_pydantic_ai()
 
-# Add parent to path for relative imports when running as script
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+    from biosciences_temporal.temporal.worker import main as worker_main
 
-from src.biosciences_temporal.temporal.worker import main
+    asyncio.run(worker_main())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
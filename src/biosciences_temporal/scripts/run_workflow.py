@@ -6,41 +6,116 @@ Requires the Temporal worker to be running.
 
 Usage:
     # Start new workflow
-    uv run python -m src.biosciences_temporal.scripts.run_workflow
+    uv run run-workflow
 
     # Custom genes
-    uv run python -m src.biosciences_temporal.scripts.run_workflow --gene-a BRCA1 --gene-b PARP1
+    uv run run-workflow --gene-a BRCA1 --gene-b PARP1
 
     # Resume existing workflow
-    uv run python -m src.biosciences_temporal.scripts.run_workflow -w <workflow-id>
+    uv run run-workflow -w <workflow-id>
+
+    # One workflow per line of a TSV: gene_a, gene_b[, target_name[, condition]]
+    uv run run-workflow --pairs-file pairs.tsv
 """
 
 import argparse
 import asyncio
-import os
-import sys
-
-# Add parent to path for relative imports when running as script
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
-
-from src.biosciences_temporal.temporal.client import start_workflow, get_result
-
-
-async def main():
+import csv
+
+from pydantic_core import from_json, to_json
+
+from biosciences_temporal.temporal.client import (
+    get_result,
+    start_workflow,
+    start_workflows_bulk,
+    watch_progress,
+)
+
+
+async def _wait_with_progress(workflow_id: str) -> str:
+    """Wait for the result, printing activities as they complete."""
+    watcher = asyncio.create_task(watch_progress(workflow_id))
+    try:
+        return await get_result(workflow_id)
+    finally:
+        watcher.cancel()
+
+
+def _pretty(result: str) -> str:
+    """Indent a compact JSON workflow result for display."""
+    return to_json(from_json(result), indent=2).decode()
+
+
+def _read_pairs(path: str) -> list[tuple[str, ...]]:
+    """Read workflow inputs from a TSV, skipping blank and # comment lines.
+
+    Each row is gene_a, gene_b[, target_name[, condition]].
+
+    Raises:
+        ValueError: If a row has the wrong number of columns or an empty
+            field, naming the file and line.
+    """
+    pairs = []
+    with open(path, newline="") as f:
+        reader = csv.reader(f, delimiter="\t")
+        for row in reader:
+            fields = tuple(field.strip() for field in row)
+            if not any(fields) or fields[0].startswith("#"):
+                continue
+            if not 2 <= len(fields) <= 4:
+                raise ValueError(
+                    f"{path}:{reader.line_num}: expected 2-4 tab-separated columns "
+                    f"(gene_a, gene_b[, target_name[, condition]]), got {len(fields)}"
+                )
+            if not all(fields):
+                raise ValueError(f"{path}:{reader.line_num}: empty field in {fields!r}")
+            pairs.append(fields)
+    return pairs
+
+
+async def _run_bulk(pairs: list[tuple[str, ...]], wait: bool) -> None:
+    """Start a workflow per pair and print results as they finish."""
+    workflow_ids = await start_workflows_bulk(pairs)
+    if not wait:
+        for workflow_id in workflow_ids:
+            print(f"  {workflow_id}")
+        return
+
+    async def labeled(workflow_id: str) -> tuple[str, str]:
+        return workflow_id, await get_result(workflow_id)
+
+    for next_done in asyncio.as_completed([labeled(w) for w in workflow_ids]):
+        workflow_id, result = await next_done
+        print("\n" + "=" * 60)
+        print(f"WORKFLOW RESULT: {workflow_id}")
+        print("=" * 60)
+        print(_pretty(result))
+
+
+async def _main():
     parser = argparse.ArgumentParser(description="Trigger CQ14 workflow via Temporal")
     parser.add_argument("--gene-a", default="TP53", help="First gene in synthetic lethal pair")
     parser.add_argument("--gene-b", default="TYMS", help="Second gene (drug target)")
     parser.add_argument("--target-name", default="thymidylate synthase", help="Target name for drug search")
     parser.add_argument("--condition", default="cancer", help="Disease condition for trial search")
     parser.add_argument("-w", "--workflow-id", help="Resume existing workflow by ID")
+    parser.add_argument("--pairs-file", help="TSV of gene pairs; starts one workflow per row")
     parser.add_argument("--no-wait", action="store_true", help="Start workflow but don't wait for result")
 
     args = parser.parse_args()
 
+    if args.pairs_file:
+        try:
+            pairs = _read_pairs(args.pairs_file)
+        except ValueError as e:
+            parser.error(str(e))
+        await _run_bulk(pairs, wait=not args.no_wait)
+        return
+
     if args.workflow_id:
         # Resume existing workflow
         print(f"Getting result for workflow: {args.workflow_id}")
-        result = await get_result(args.workflow_id)
+        result = await _wait_with_progress(args.workflow_id)
     else:
         # Start new workflow
         workflow_id = await start_workflow(
@@ -56,13 +131,17 @@ async def main():
             return
 
         print(f"Waiting for workflow to complete...")
-        result = await get_result(workflow_id)
+        result = await _wait_with_progress(workflow_id)
 
     print("\n" + "=" * 60)
     print("WORKFLOW RESULT")
     print("=" * 60)
-    print(result)
+    print(_pretty(result))
+
+
+def main():
+    asyncio.run(_main())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -6,8 +6,8 @@ Provides thin activity wrappers, workflow definition, and worker configuration.
 IMPORTANT: Do not add imports here - they trigger Temporal sandbox restrictions.
 Import directly from the specific module you need:
 
-    from src.biosciences_temporal.temporal.activities import ALL_ACTIVITIES
-    from src.biosciences_temporal.temporal.workflows import CQ14Workflow
+    from biosciences_temporal.temporal.activities import ALL_ACTIVITIES
+    from biosciences_temporal.temporal.workflows import CQ14Workflow
 """
 
 __all__: list[str] = []  # Explicit empty exports to encourage direct imports
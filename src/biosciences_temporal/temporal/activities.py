@@ -2,12 +2,21 @@
 Temporal activity definitions for CQ14 workflow.
 
 These are thin wrappers around the PydanticAI agents defined in agents/.
-Each activity creates its own MCP client, uses it, and closes it within
-the same task context (one-shot pattern) to avoid cancel scope conflicts.
+Activities share MCP servers from the process-wide pool in agents/base.py.
+Each pooled server is opened and closed by its own owner task, so the
+anyio cancel scope never crosses activity task boundaries.
+
+resolve_gene and enrich_protein are memoized in the agents layer
+(agent_cache, 24h TTL, keyed by normalized symbol / UniProt ID), so
+repeated genes across workflow runs on a worker skip the agent entirely.
 """
 
+from pydantic import TypeAdapter
 from temporalio import activity
 
+from ..agents import is_retryable
+from ..config import VALIDATOR_RETRY
+
 # Import agents (these are standalone PydanticAI agents)
 from ..agents.resolve import resolve_gene as _resolve_gene
 from ..agents.enrich import enrich_protein as _enrich_protein
@@ -19,7 +28,27 @@ from ..agents.validate import (
     validate_drug as _validate_drug,
     validate_trial as _validate_trial,
     validate_synthetic_lethality as _validate_synthetic_lethality,
+    validate_batch as _validate_batch,
+    validate_all as _validate_all,
 )
+from ..agents.models import (
+    ClinicalTrial,
+    DrugCandidate,
+    GeneInteraction,
+    ValidationEvidence,
+)
+
+# List results are dumped in one pass instead of a model_dump() per row
+_INTERACTION_LIST = TypeAdapter(list[GeneInteraction])
+_DRUG_LIST = TypeAdapter(list[DrugCandidate])
+_TRIAL_LIST = TypeAdapter(list[ClinicalTrial])
+_EVIDENCE_LIST = TypeAdapter(list[ValidationEvidence])
+
+# Drugs/trials kept per activity result, in agent order. Results are
+# recorded in workflow history and re-read on every replay, and the
+# workflow only uses the first few
+MAX_DRUGS = 10
+MAX_TRIALS = 10
 
 
 # --- Phase 1: Anchor ---
@@ -46,6 +75,34 @@ async def enrich_protein(uniprot_id: str) -> dict:
     return result.model_dump()
 
 
+# --- Phases 1+2: Anchor and Enrich ---
+
+@activity.defn
+async def resolve_and_enrich(gene_symbol: str) -> dict:
+    """Resolve a gene symbol and enrich its protein in one activity.
+
+    Saves the workflow a round-trip between phases: enrichment starts as
+    soon as the UniProt ID is known, on the same pooled MCP connection.
+    A transient enrichment failure is raised so API_RETRY retries it, as
+    it would the separate enrich activity. A permanent one is logged and
+    returned as None so the resolution is kept. Both lookups are cached,
+    so a retry on the same worker doesn't repeat finished agent runs.
+
+    Returns:
+        {"resolution": GeneInfo dict, "protein": ProteinFunction dict or None}
+    """
+    gene = await _resolve_gene(gene_symbol)
+    protein = None
+    if gene.uniprot_id:
+        try:
+            protein = (await _enrich_protein(gene.uniprot_id)).model_dump()
+        except Exception as e:
+            if is_retryable(e):
+                raise
+            activity.logger.warning(f"Protein enrichment failed for {gene.uniprot_id}: {e}")
+    return {"resolution": gene.model_dump(), "protein": protein}
+
+
 # --- Phase 3: Expand ---
 
 @activity.defn
@@ -55,7 +112,7 @@ async def expand_interactions(gene_symbol: str) -> dict:
     Temporal activity wrapping the expand agent.
     """
     result = await _expand_interactions(gene_symbol)
-    return {"interactions": [i.model_dump() for i in result]}
+    return {"interactions": _INTERACTION_LIST.dump_python(result)}
 
 
 # --- Phase 4: Traverse ---
@@ -67,7 +124,7 @@ async def find_drugs(target_name: str) -> list[dict]:
     Temporal activity wrapping the drugs agent.
     """
     result = await _find_drugs(target_name)
-    return [d.model_dump() for d in result]
+    return _DRUG_LIST.dump_python(result[:MAX_DRUGS])
 
 
 @activity.defn
@@ -77,28 +134,48 @@ async def search_trials(drug_name: str, condition: str = "cancer") -> list[dict]
     Temporal activity wrapping the trials agent.
     """
     result = await _search_trials(drug_name, condition)
-    return [t.model_dump() for t in result]
+    return _TRIAL_LIST.dump_python(result[:MAX_TRIALS])
 
 
 # --- Phase 5: Validate ---
 
+def _gene_claim(symbol: str, resolution: dict) -> str:
+    """Render a gene resolution as a validator prompt."""
+    return (
+        f"{symbol}: HGNC={resolution.get('hgnc_id')}, "
+        f"Entrez={resolution.get('entrez_id', 'N/A')}"
+    )
+
+
+def _drug_claim(drug: dict) -> str:
+    """Render a drug candidate as a validator prompt."""
+    return (
+        f"{drug.get('chembl_id')} - {drug.get('name')}, "
+        f"target={drug.get('target_name')}, mechanism={drug.get('mechanism')}"
+    )
+
+
 @activity.defn
-async def validate_gene(claim: str) -> dict:
+async def validate_gene(gene: dict) -> dict:
     """Validate gene identifiers.
 
-    Temporal activity wrapping the gene validation agent.
+    Temporal activity wrapping the gene validation agent. Takes a
+    resolve_gene result (symbol, hgnc_id, entrez_id, ...) rather than a
+    pre-rendered claim; the prompt is built here.
     """
-    result = await _validate_gene(claim)
+    result = await _validate_gene(_gene_claim(gene.get("symbol", ""), gene))
     return result.model_dump()
 
 
 @activity.defn
-async def validate_mechanism(claim: str) -> dict:
+async def validate_mechanism(drug: dict) -> dict:
     """Validate drug/compound exists in ChEMBL.
 
-    Temporal activity wrapping the drug validation agent.
+    Temporal activity wrapping the drug validation agent. Takes a
+    find_drugs result (chembl_id, name, target_name, mechanism) rather
+    than a pre-rendered claim; the prompt is built here.
     """
-    result = await _validate_drug(claim)
+    result = await _validate_drug(_drug_claim(drug))
     return result.model_dump()
 
 
@@ -122,11 +199,87 @@ async def validate_synthetic_lethality(gene_a: str, gene_b: str) -> dict:
     return result.model_dump()
 
 
+@activity.defn
+async def validate_batch(items: list[dict]) -> list[dict]:
+    """Validate several claims in one agent run.
+
+    Temporal activity wrapping the batch validation agent. Each item is
+    {"kind": "gene" | "drug" | "trial" | "sl", "claim": str}. Prefer this
+    over the per-entity validators when all claims are known upfront.
+    """
+    result = await _validate_batch([(item["kind"], item["claim"]) for item in items])
+    return _EVIDENCE_LIST.dump_python(result)
+
+
+def _claims(bundle: dict) -> list[tuple[str, ...]]:
+    """Build (kind, *args) validator claims from raw CQ14 phase outputs."""
+    claims: list[tuple[str, ...]] = []
+
+    # Gene identifiers, from (symbol, resolution) pairs
+    for symbol, resolution in bundle.get("genes", []):
+        claims.append(("gene", _gene_claim(symbol, resolution)))
+
+    # Drug compounds; without an ID and target there is nothing to verify
+    for drug in bundle.get("drugs", []):
+        if not (drug.get("chembl_id") and drug.get("target_name")):
+            continue
+        claims.append(("drug", _drug_claim(drug)))
+
+    # Clinical trial, if it carries a well-formed NCT ID
+    trial = bundle.get("trial") or {}
+    if (nct_id := trial.get("nct_id") or "").startswith("NCT"):
+        claims.append(("trial", nct_id))
+
+    # Synthetic lethality
+    if sl_pair := bundle.get("sl_pair"):
+        claims.append(("sl", *sl_pair))
+
+    return claims
+
+
+@activity.defn
+async def validate_all(bundle: dict) -> list[dict]:
+    """Run every Phase 5 validator concurrently in one activity.
+
+    Temporal activity wrapping validate_all. The bundle carries raw phase
+    outputs and claim strings are built here, once, rather than in
+    workflow code that re-runs on every replay:
+    {"genes": [[symbol, resolution], ...], "drugs": [drug, ...],
+    "trial": trial or None, "sl_pair": [gene_a, gene_b]}.
+    A claim that fails permanently is logged and left out of the result,
+    so one bad claim doesn't fail the whole bundle. If any failure is
+    transient, the first one is raised so VALIDATOR_RETRY re-runs the
+    bundle; on the last attempt the claims that succeeded are returned
+    instead, so a failing retry never discards them. If every claim
+    failed, the first error is raised.
+    """
+    claims = _claims(bundle)
+    results = await _validate_all(claims)
+    validations = []
+    failures: list[BaseException] = []
+    for claim, result in zip(claims, results):
+        if isinstance(result, BaseException):
+            activity.logger.warning(f"Validation {claim[0]} failed: {result}")
+            failures.append(result)
+        else:
+            validations.append(result)
+
+    max_attempts = VALIDATOR_RETRY.maximum_attempts  # 0 means unlimited
+    last_attempt = 0 < max_attempts <= activity.info().attempt
+    retryable = [e for e in failures if is_retryable(e)]
+    if retryable and not last_attempt:
+        raise retryable[0]
+    if failures and not validations:
+        raise failures[0]
+    return _EVIDENCE_LIST.dump_python(validations)
+
+
 # --- Activity Registry ---
 
 ALL_ACTIVITIES = [
     resolve_gene,
     enrich_protein,
+    resolve_and_enrich,
     expand_interactions,
     find_drugs,
     search_trials,
@@ -134,4 +287,6 @@ ALL_ACTIVITIES = [
     validate_mechanism,
     validate_trial,
     validate_synthetic_lethality,
+    validate_batch,
+    validate_all,
 ]
@@ -5,17 +5,32 @@ Provides functions to start new workflows or get results from existing ones.
 """
 
 import asyncio
-import json
 import uuid
-from dataclasses import asdict
+from collections.abc import Sequence
 from typing import Optional
 
+from temporalio.api.enums.v1 import EventType
 from temporalio.client import Client
 
-from ..config import TASK_QUEUE
+from ..config import TASK_QUEUE, TEMPORAL_ADDRESS
 from .workflows import CQ14Input, CQ14Workflow
 
 
+# Connected once per process and reused for every workflow operation
+_client: Optional[Client] = None
+_client_lock = asyncio.Lock()
+
+
+async def _get_client() -> Client:
+    """Return the shared Temporal client, connecting on first use."""
+    global _client
+    if _client is None:
+        async with _client_lock:
+            if _client is None:
+                _client = await Client.connect(TEMPORAL_ADDRESS)
+    return _client
+
+
 async def start_workflow(
     gene_a: str = "TP53",
     gene_b: str = "TYMS",
@@ -35,7 +50,7 @@ async def start_workflow(
     Returns:
         The workflow ID.
     """
-    client = await Client.connect("localhost:7233")
+    client = await _get_client()
 
     if workflow_id is None:
         workflow_id = f"cq14-{gene_a}-{gene_b}-{uuid.uuid4().hex[:8]}"
@@ -49,7 +64,7 @@ async def start_workflow(
 
     handle = await client.start_workflow(
         CQ14Workflow.run,
-        json.dumps(asdict(input_data)),
+        input_data,
         id=workflow_id,
         task_queue=TASK_QUEUE,
     )
@@ -60,6 +75,46 @@ async def start_workflow(
     return workflow_id
 
 
+async def start_workflows_bulk(pairs: Sequence[tuple[str, ...]]) -> list[str]:
+    """Start one CQ14 workflow per gene pair, all at once.
+
+    Uses the shared client, so N workflows cost one connection and N
+    concurrent start requests.
+
+    Args:
+        pairs: (gene_a, gene_b[, target_name[, condition]]) tuples; omitted
+            fields take the CQ14Input defaults.
+
+    Returns:
+        The workflow IDs, in input order.
+
+    Raises:
+        ValueError: If a pair has the wrong number of fields or an empty one.
+    """
+    for i, pair in enumerate(pairs):
+        if not 2 <= len(pair) <= 4 or not all(pair):
+            raise ValueError(
+                f"pairs[{i}]: expected 2-4 non-empty fields "
+                f"(gene_a, gene_b[, target_name[, condition]]), got {pair!r}"
+            )
+
+    client = await _get_client()
+
+    inputs = [CQ14Input(*pair) for pair in pairs]
+    handles = await asyncio.gather(*(
+        client.start_workflow(
+            CQ14Workflow.run,
+            input_data,
+            id=f"cq14-{input_data.gene_a}-{input_data.gene_b}-{uuid.uuid4().hex[:8]}",
+            task_queue=TASK_QUEUE,
+        )
+        for input_data in inputs
+    ))
+
+    print(f"Started {len(handles)} workflows")
+    return [handle.id for handle in handles]
+
+
 async def get_result(workflow_id: str) -> str:
     """Get the result of an existing workflow.
 
@@ -69,7 +124,7 @@ async def get_result(workflow_id: str) -> str:
     Returns:
         The workflow result as JSON.
     """
-    client = await Client.connect("localhost:7233")
+    client = await _get_client()
 
     handle = client.get_workflow_handle(workflow_id)
     result = await handle.result()
@@ -77,6 +132,33 @@ async def get_result(workflow_id: str) -> str:
     return result
 
 
+async def watch_progress(workflow_id: str) -> None:
+    """Print each activity of a workflow as it finishes.
+
+    Follows the workflow history as new events arrive, so progress shows
+    while the workflow runs. Returns when the workflow closes; callers
+    usually cancel it once the result is in.
+
+    Args:
+        workflow_id: The workflow ID to follow.
+    """
+    client = await _get_client()
+
+    handle = client.get_workflow_handle(workflow_id)
+    # Scheduled event ID -> activity name; completions only carry the ID
+    scheduled: dict[int, str] = {}
+    async for event in handle.fetch_history_events(wait_new_event=True):
+        if event.event_type == EventType.EVENT_TYPE_ACTIVITY_TASK_SCHEDULED:
+            attrs = event.activity_task_scheduled_event_attributes
+            scheduled[event.event_id] = attrs.activity_type.name
+        elif event.event_type == EventType.EVENT_TYPE_ACTIVITY_TASK_COMPLETED:
+            attrs = event.activity_task_completed_event_attributes
+            print(f"  ✓ {scheduled.get(attrs.scheduled_event_id, 'activity')}")
+        elif event.event_type == EventType.EVENT_TYPE_ACTIVITY_TASK_FAILED:
+            attrs = event.activity_task_failed_event_attributes
+            print(f"  ✗ {scheduled.get(attrs.scheduled_event_id, 'activity')}: {attrs.failure.message}")
+
+
 async def run_and_wait(
     gene_a: str = "TP53",
     gene_b: str = "TYMS",
@@ -14,17 +14,23 @@ import asyncio
 from temporalio.client import Client
 from temporalio.worker import UnsandboxedWorkflowRunner, Worker
 
-from ..config import TASK_QUEUE
+from ..agents.base import shutdown_pool, warm_pool
+from ..config import IO_TASK_QUEUE, TASK_QUEUE, TEMPORAL_ADDRESS
 from .activities import ALL_ACTIVITIES
 from .workflows import CQ14Workflow
 
+# Concurrent activities on the I/O queue; they mostly wait on MCP/LLM calls
+IO_MAX_CONCURRENT_ACTIVITIES = 200
+
 
 async def main():
     """Start the Temporal worker."""
-    print(f"Connecting to Temporal at localhost:7233...")
-    client = await Client.connect("localhost:7233")
+    print(f"Connecting to Temporal at {TEMPORAL_ADDRESS}...")
+    # temporalio's default keepalive (30s ping, 15s timeout) already keeps
+    # the long-lived worker connection alive
+    client = await Client.connect(TEMPORAL_ADDRESS)
 
-    print(f"Starting worker on task queue: {TASK_QUEUE}")
+    print(f"Starting worker on task queues: {TASK_QUEUE}, {IO_TASK_QUEUE}")
     print(f"Registered workflow: CQ14Workflow")
     print(f"Registered activities: {len(ALL_ACTIVITIES)}")
 
@@ -38,9 +44,24 @@ async def main():
         activities=ALL_ACTIVITIES,
         workflow_runner=UnsandboxedWorkflowRunner(),
     )
+    # Activities only: long I/O activities are scheduled here (see
+    # LONG_ACTIVITY_CONFIG), so they scale without taking the main pollers
+    io_worker = Worker(
+        client,
+        task_queue=IO_TASK_QUEUE,
+        activities=ALL_ACTIVITIES,
+        max_concurrent_activities=IO_MAX_CONCURRENT_ACTIVITIES,
+    )
+
+    try:
+        print("Starting MCP gateway...")
+        await warm_pool()
 
-    print("Worker running (sandbox disabled). Press Ctrl+C to stop.")
-    await worker.run()
+        print("Worker running (sandbox disabled). Press Ctrl+C to stop.")
+        await asyncio.gather(worker.run(), io_worker.run())
+    finally:
+        # Stop the pooled MCP subprocesses shared by all activities
+        await shutdown_pool()
 
 
 if __name__ == "__main__":
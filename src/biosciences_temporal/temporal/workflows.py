@@ -5,18 +5,49 @@ Orchestrates the 5-phase Fuzzy-to-Fact protocol with durable execution.
 """
 
 import asyncio
-import json
-from dataclasses import asdict, dataclass, field
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Optional
 
 from temporalio import workflow
 
 # Pass through non-deterministic imports (pydantic, anyio, etc.)
 with workflow.unsafe.imports_passed_through():
-    from ..config import LONG_ACTIVITY_CONFIG, SHORT_ACTIVITY_CONFIG
-
-
-@dataclass
+    from pydantic_core import to_json
+
+    from ..config import (
+        API_CONFIG,
+        LONG_ACTIVITY_CONFIG,
+        SEARCH_CONFIG,
+        VALIDATOR_CONFIG,
+        ActivityConfig,
+    )
+
+
+def _execute(activity: str, args: list, config: ActivityConfig):
+    """Start an activity with the timeouts and retry policy from config."""
+    return workflow.execute_activity(
+        activity,
+        args=args,
+        start_to_close_timeout=config.start_to_close_timeout,
+        schedule_to_close_timeout=config.schedule_to_close_timeout,
+        retry_policy=config.retry_policy,
+        task_queue=config.task_queue,
+    )
+
+
+def _execute_local(activity: str, args: list, config: ActivityConfig):
+    """Run a short activity in this worker, skipping the task-queue round-trip."""
+    return workflow.execute_local_activity(
+        activity,
+        args=args,
+        start_to_close_timeout=config.start_to_close_timeout,
+        schedule_to_close_timeout=config.schedule_to_close_timeout,
+        retry_policy=config.retry_policy,
+    )
+
+
+@dataclass(slots=True)
 class CQ14Input:
     """Input for CQ14 workflow."""
     gene_a: str = "TP53"
@@ -25,7 +56,7 @@ class CQ14Input:
     condition: str = "cancer"
 
 
-@dataclass
+@dataclass(slots=True)
 class CQ14Result:
     """Complete result of CQ14 workflow."""
     gene_a_resolution: Optional[dict] = None
@@ -33,9 +64,11 @@ class CQ14Result:
     gene_a_protein: Optional[dict] = None
     gene_b_protein: Optional[dict] = None
     gene_b_interactions: Optional[dict] = None
-    drugs: list = field(default_factory=list)
-    trials: list = field(default_factory=list)
-    validations: list = field(default_factory=list)
+    # Assigned whole from activity results, never appended to; the empty
+    # tuple default is shared instead of allocating three lists per result
+    drugs: Sequence[dict] = ()
+    trials: Sequence[dict] = ()
+    validations: Sequence[dict] = ()
 
 
 @workflow.defn
@@ -50,177 +83,143 @@ class CQ14Workflow:
     5. Validate - Verify claims
     """
 
-    @workflow.run
-    async def run(self, input_json: str) -> str:
-        """Execute the CQ14 validation workflow."""
-        input_dict = json.loads(input_json)
-        input_data = CQ14Input(**input_dict)
-        result = CQ14Result()
-
-        # Phase 1: Anchor - Resolve both genes in parallel
-        workflow.logger.info(f"Phase 1: Anchoring {input_data.gene_a} and {input_data.gene_b}")
-
-        gene_a_task = workflow.execute_activity(
-            "resolve_gene",
-            args=[input_data.gene_a],
-            **SHORT_ACTIVITY_CONFIG,
-        )
-        gene_b_task = workflow.execute_activity(
-            "resolve_gene",
-            args=[input_data.gene_b],
-            **SHORT_ACTIVITY_CONFIG,
-        )
-
-        gene_results = await asyncio.gather(gene_a_task, gene_b_task, return_exceptions=True)
-
-        if not isinstance(gene_results[0], Exception):
-            result.gene_a_resolution = gene_results[0]
-        if not isinstance(gene_results[1], Exception):
-            result.gene_b_resolution = gene_results[1]
-
-        # Phase 2: Enrich - Get protein context
-        workflow.logger.info("Phase 2: Enriching protein context")
-
-        enrich_tasks = []
-        if result.gene_a_resolution and result.gene_a_resolution.get("uniprot_id"):
-            enrich_tasks.append(
-                workflow.execute_activity(
-                    "enrich_protein",
-                    args=[result.gene_a_resolution["uniprot_id"]],
-                    **SHORT_ACTIVITY_CONFIG,
-                )
-            )
-        if result.gene_b_resolution and result.gene_b_resolution.get("uniprot_id"):
-            enrich_tasks.append(
-                workflow.execute_activity(
-                    "enrich_protein",
-                    args=[result.gene_b_resolution["uniprot_id"]],
-                    **SHORT_ACTIVITY_CONFIG,
-                )
-            )
-
-        if enrich_tasks:
-            enrich_results = await asyncio.gather(*enrich_tasks, return_exceptions=True)
-            if len(enrich_results) > 0 and not isinstance(enrich_results[0], Exception):
-                result.gene_a_protein = enrich_results[0]
-            if len(enrich_results) > 1 and not isinstance(enrich_results[1], Exception):
-                result.gene_b_protein = enrich_results[1]
-
-        # Phase 3: Expand - Get interactions for target gene
-        workflow.logger.info("Phase 3: Expanding interaction network")
-
-        try:
-            result.gene_b_interactions = await workflow.execute_activity(
-                "expand_interactions",
-                args=[input_data.gene_b],
-                **LONG_ACTIVITY_CONFIG,
-            )
-        except Exception as e:
-            workflow.logger.warning(f"Interaction expansion failed: {e}")
-
+    async def _traverse(self, input_data: CQ14Input, result: CQ14Result) -> None:
+        """Phases 4a and 4b: find drugs, then search trials for the top drug."""
         # Phase 4a: Traverse - Find drugs targeting the protein
         workflow.logger.info("Phase 4a: Finding drugs targeting the protein")
 
         try:
-            result.drugs = await workflow.execute_activity(
+            result.drugs = await _execute(
                 "find_drugs",
-                args=[input_data.target_name],
-                **LONG_ACTIVITY_CONFIG,
+                [input_data.target_name],
+                LONG_ACTIVITY_CONFIG,
             )
         except Exception as e:
-            workflow.logger.warning(f"Drug discovery failed: {e}")
+            workflow.logger.warning("Drug discovery failed: %s", e)
 
-        # Phase 4b: Traverse - Search clinical trials using discovered drug names
+        # Phase 4b: Traverse - Search clinical trials using discovered drug names.
+        # Not prefetched for the target name: the top drug is a compound and
+        # never named like the target, so that search would almost always be wasted
         workflow.logger.info("Phase 4b: Searching clinical trials")
 
         if result.drugs:
             # Use first discovered drug name for trial search
             drug_name = result.drugs[0].get("name", input_data.target_name)
-            workflow.logger.info(f"Searching trials for drug: {drug_name}")
+            workflow.logger.info("Searching trials for drug: %s", drug_name)
         else:
             # Fallback to target name if no drugs found
             drug_name = input_data.target_name
-            workflow.logger.warning(f"No drugs found, searching trials for: {drug_name}")
+            workflow.logger.warning("No drugs found, searching trials for: %s", drug_name)
 
         try:
-            result.trials = await workflow.execute_activity(
+            result.trials = await _execute(
                 "search_trials",
-                args=[drug_name, input_data.condition],
-                **LONG_ACTIVITY_CONFIG,
+                [drug_name, input_data.condition],
+                SEARCH_CONFIG,
             )
         except Exception as e:
-            workflow.logger.warning(f"Trial search failed: {e}")
+            workflow.logger.warning("Trial search failed: %s", e)
 
-        # Phase 5: Validate - Run validators in parallel
-        workflow.logger.info("Phase 5: Running validation agents")
+    @workflow.run
+    async def run(self, input_data: CQ14Input) -> str:
+        """Execute the CQ14 validation workflow.
 
-        validation_tasks = []
+        The input dataclass is decoded by Temporal's default data converter.
+        Log calls pass %-style arguments: workflow.logger drops records
+        during replay, so messages are only formatted on first execution.
+        """
+        result = CQ14Result()
 
-        # Validate gene A
-        if result.gene_a_resolution:
-            claim = (
-                f"{input_data.gene_a}: HGNC={result.gene_a_resolution.get('hgnc_id')}, "
-                f"Entrez={result.gene_a_resolution.get('entrez_id', 'N/A')}"
-            )
-            validation_tasks.append(
-                workflow.execute_activity(
-                    "validate_gene",
-                    args=[claim],
-                    **SHORT_ACTIVITY_CONFIG,
-                )
-            )
+        # Phases 3 and 4 depend only on the input, so start them first and
+        # let them overlap with anchoring and enrichment
+        workflow.logger.info("Phases 3-4: Expanding interactions and traversing to drugs")
+
+        interactions_task = asyncio.create_task(_execute(
+            "expand_interactions",
+            [input_data.gene_b],
+            LONG_ACTIVITY_CONFIG,
+        ))
+        # Trials start as soon as drugs are in, not after the slowest phase
+        traverse_task = asyncio.create_task(self._traverse(input_data, result))
+
+        # Phases 1+2: Anchor and Enrich - Resolve and enrich both genes in parallel
+        workflow.logger.info(
+            "Phases 1-2: Anchoring and enriching %s and %s", input_data.gene_a, input_data.gene_b
+        )
 
-        # Validate gene B
-        if result.gene_b_resolution:
-            claim = (
-                f"{input_data.gene_b}: HGNC={result.gene_b_resolution.get('hgnc_id')}, "
-                f"Entrez={result.gene_b_resolution.get('entrez_id', 'N/A')}"
-            )
-            validation_tasks.append(
-                workflow.execute_activity(
-                    "validate_gene",
-                    args=[claim],
-                    **SHORT_ACTIVITY_CONFIG,
-                )
-            )
+        # One activity per distinct symbol; gene_a == gene_b shares its task.
+        # Distinct symbols with the same UniProt ID are coalesced by the
+        # enrich cache in the worker
+        key_a = input_data.gene_a.strip().upper()
+        key_b = input_data.gene_b.strip().upper()
+        gene_tasks: dict[str, asyncio.Task] = {}
+        for key, symbol in ((key_a, input_data.gene_a), (key_b, input_data.gene_b)):
+            if key not in gene_tasks:
+                gene_tasks[key] = asyncio.create_task(_execute(
+                    "resolve_and_enrich",
+                    [symbol],
+                    API_CONFIG,
+                ))
+
+        gene_results = await asyncio.gather(
+            gene_tasks[key_a], gene_tasks[key_b], return_exceptions=True
+        )
 
-        # Validate drug compounds (top 2)
-        for drug in result.drugs[:2]:
-            claim = (
-                f"{drug.get('chembl_id')} - {drug.get('name')}, "
-                f"target={drug.get('target_name')}, mechanism={drug.get('mechanism')}"
-            )
-            validation_tasks.append(
-                workflow.execute_activity(
-                    "validate_mechanism",
-                    args=[claim],
-                    **SHORT_ACTIVITY_CONFIG,
-                )
-            )
+        if not isinstance(gene_results[0], BaseException):
+            result.gene_a_resolution = gene_results[0]["resolution"]
+            result.gene_a_protein = gene_results[0]["protein"]
+        if not isinstance(gene_results[1], BaseException):
+            result.gene_b_resolution = gene_results[1]["resolution"]
+            result.gene_b_protein = gene_results[1]["protein"]
 
-        # Validate first trial
-        if result.trials:
-            validation_tasks.append(
-                workflow.execute_activity(
-                    "validate_trial",
-                    args=[result.trials[0].get("nct_id", "")],
-                    **SHORT_ACTIVITY_CONFIG,
-                )
-            )
+        # Phase 3: collect the interactions started above
+        try:
+            result.gene_b_interactions = await interactions_task
+        except Exception as e:
+            workflow.logger.warning("Interaction expansion failed: %s", e)
 
-        # Validate synthetic lethality
-        validation_tasks.append(
-            workflow.execute_activity(
-                "validate_synthetic_lethality",
-                args=[input_data.gene_a, input_data.gene_b],
-                **SHORT_ACTIVITY_CONFIG,
-            )
-        )
+        # Phase 4: drugs and trials; _traverse handles its own failures
+        await traverse_task
 
-        validation_results = await asyncio.gather(*validation_tasks, return_exceptions=True)
-        result.validations = [
-            v for v in validation_results if not isinstance(v, Exception)
+        # Phase 5: Validate - Run validators in parallel
+        workflow.logger.info("Phase 5: Running validation agents")
+
+        # Raw phase outputs; the activity turns them into claim strings
+        genes = [
+            [symbol, resolution]
+            for symbol, resolution in (
+                (input_data.gene_a, result.gene_a_resolution),
+                (input_data.gene_b, result.gene_b_resolution),
+            )
+            if resolution
         ]
+        bundle = {
+            "genes": genes,
+            "drugs": result.drugs[:2],
+            "trial": result.trials[0] if result.trials else None,
+            # SL needs both genes resolved; otherwise it is a guaranteed miss
+            "sl_pair": (
+                [input_data.gene_a, input_data.gene_b]
+                if result.gene_a_resolution and result.gene_b_resolution
+                else None
+            ),
+        }
+
+        # One activity runs all validators concurrently and drops failures
+        if any(bundle.values()):
+            try:
+                result.validations = await _execute_local(
+                    "validate_all",
+                    [bundle],
+                    VALIDATOR_CONFIG,
+                )
+            except Exception as e:
+                workflow.logger.warning("Validation failed: %s", e)
+        else:
+            workflow.logger.warning("Nothing to validate")
 
         workflow.logger.info("Workflow complete")
-        return json.dumps(asdict(result), indent=2)
+        # Compact JSON, since the workflow thread is the bottleneck and clients
+        # pretty-print. to_json walks the dataclass directly, where asdict()
+        # would deep-copy it first.
+        return to_json(result).decode()